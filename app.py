@@ -4,13 +4,34 @@ NewsBreeze - Celebrity-Powered Audio News Reader - Question 3 Solution
 A Flask web application for news aggregation with AI summarization and voice synthesis.
 """
 
-from flask import Flask, render_template, request, jsonify, send_file
+import time
+_start_time = time.perf_counter()
+
+from flask import Flask, Response, render_template, request, jsonify, send_file, stream_with_context
+from werkzeug.local import LocalProxy
 import os
-import json
 import hashlib
 import logging
-from datetime import datetime, timedelta
+import multiprocessing
+import threading
+from functools import partial
+from datetime import datetime, timezone
+from collections import Counter
 from news_fetcher import NewsFetcher
+from news_refresher import NewsRefresher
+from article_store import ArticleStore
+from article_archive import ArticleArchive, encode_cursor, decode_cursor
+from response_cache import ResponseCache
+from dedup import StoryDeduplicator
+from search_index import SearchIndex
+from prefetch_pipeline import PrefetchPipeline
+from summary_store import SummaryStore
+from audio_cache import AudioCache
+from singleflight import SingleFlight
+from synthesis_jobs import SynthesisJobManager
+from audio_utils import to_pcm16, wav_header, write_wav
+from audio_transcoder import AudioTranscoder, AUDIO_MIMETYPES
+from model_warmup import ModelWarmup
 from summarizer import NewsSummarizer
 from voice_synthesizer import VoiceSynthesizer
 from config import *
@@ -20,17 +41,66 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
+app.config['USE_X_SENDFILE'] = AUDIO_USE_X_SENDFILE
+
+def get_article_text(article):
+    """Text of a fetched article as the client sends it to /api/summarize."""
+    return article.get('description', '')
 
 class NewsBreeze:
     """Main NewsBreeze application service."""
     
     def __init__(self):
         self.news_fetcher = NewsFetcher()
-        self.summarizer = NewsSummarizer()
-        self.voice_synthesizer = VoiceSynthesizer()
+        # Models run in worker processes when configured, otherwise in-process
+        if SUMMARIZER_WORKERS > 0:
+            from model_workers import SummarizerClient
+            self.summarizer = SummarizerClient(SUMMARIZER_WORKERS)
+        else:
+            self.summarizer = NewsSummarizer()
+        if TTS_WORKERS > 0:
+            from model_workers import VoiceSynthesizerClient
+            self.voice_synthesizer = VoiceSynthesizerClient(TTS_WORKERS)
+        else:
+            self.voice_synthesizer = VoiceSynthesizer()
+        self.warmup = ModelWarmup({
+            'summarizer': self.summarizer,
+            'voice_synthesizer': self.voice_synthesizer
+        })
         self.ensure_directories()
-        self.cached_news = []
-        self.last_fetch = None
+        self.summary_store = SummaryStore(os.path.join(CACHE_DIR, 'summaries.db'))
+        self.audio_cache = AudioCache(AUDIO_DIR)
+        self.transcoder = AudioTranscoder(AUDIO_DIR, self.audio_cache)
+        self.summary_flight = SingleFlight()
+        self.audio_flight = SingleFlight()
+        self.synthesis_jobs = SynthesisJobManager(partial(self.synthesize_voice, wait=True))
+        self.search_index = SearchIndex()
+        self.archive = ArticleArchive(os.path.join(CACHE_DIR, 'articles.db'))
+        self.refresher = NewsRefresher(
+            self.news_fetcher,
+            store=ArticleStore(
+                StoryDeduplicator() if DEDUP_ENABLED else None,
+                index=self.search_index
+            ),
+            archive=self.archive,
+            max_articles=MAX_NEWS_ARTICLES,
+            on_refresh=self._on_refresh
+        )
+        self.prefetch = PrefetchPipeline(self)
+        self.news_responses = ResponseCache()
+        self.voice_usage = Counter()
+        self._voice_usage_lock = threading.Lock()
+        
+        # Serve the archived articles until the feeds have been refetched
+        self.refresher.warm_start()
+    
+    @property
+    def cached_news(self):
+        return self.refresher.snapshot()[0]
+    
+    @property
+    def last_fetch(self):
+        return self.refresher.last_fetch
     
     def ensure_directories(self):
         """Create necessary directories."""
@@ -38,101 +108,246 @@ class NewsBreeze:
             if not os.path.exists(directory):
                 os.makedirs(directory)
     
-    def get_news(self, sources=None, category=None, force_refresh=False):
-        """Get news articles with caching."""
+    def get_news(self, sources=None, category=None, force_refresh=False,
+                 cursor=None, limit=MAX_NEWS_ARTICLES, fields=None):
+        """
+        Get news articles from the in-memory snapshot.
+        
+        Args:
+            cursor: next_cursor of the previous page, or None for the first page
+            limit: Articles per page
+            fields: Article fields to include (all if empty); 'id' is always included
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        after = None
+        if cursor:
+            date_key, article_id = decode_cursor(cursor)
+            after = (datetime.fromisoformat(date_key) if date_key else datetime.min, article_id)
+        
         try:
-            # Check if we need to refresh
-            if (force_refresh or 
-                not self.last_fetch or 
-                datetime.now() - self.last_fetch > timedelta(minutes=NEWS_REFRESH_INTERVAL)):
-                
+            self.start_background_tasks()
+            
+            # Only block when forced or before the very first snapshot exists
+            if force_refresh or not self.refresher.last_fetch:
                 logger.info("Fetching fresh news...")
-                self.cached_news = self.news_fetcher.fetch_news(sources, category)
-                self.last_fetch = datetime.now()
-                
-                # Cache to file
-                cache_file = os.path.join(CACHE_DIR, 'news_cache.json')
-                with open(cache_file, 'w', encoding='utf-8') as f:
-                    json.dump({
-                        'news': self.cached_news,
-                        'timestamp': self.last_fetch.isoformat()
-                    }, f, indent=2, ensure_ascii=False)
+                self.refresher.refresh(force=force_refresh)
+            
+            # Filters are applied in memory over the shared per-source store
+            articles = self.refresher.store.query(sources, category, limit=limit + 1, after=after)
+            next_cursor = encode_cursor(articles[limit - 1]) if len(articles) > limit else None
+            articles = articles[:limit]
+            last_fetch = self.refresher.last_fetch
+            
+            if fields:
+                keep = set(fields) | {'id'}
+                articles = [{k: v for k, v in article.items() if k in keep} for article in articles]
             
             return {
                 'success': True,
-                'articles': self.cached_news,
-                'last_updated': self.last_fetch.isoformat() if self.last_fetch else None,
-                'total_articles': len(self.cached_news)
+                'articles': articles,
+                'next_cursor': next_cursor,
+                'last_updated': last_fetch.isoformat() if last_fetch else None,
+                'total_articles': len(articles)
             }
             
         except Exception as e:
             logger.error(f"Error fetching news: {e}")
             return {'success': False, 'error': str(e)}
     
+    def search_news(self, query, sources=None, category=None, since=None, until=None, limit=SEARCH_RESULTS_LIMIT):
+        """Search fetched articles, best match first."""
+        try:
+            self.start_background_tasks()
+            if not self.refresher.last_fetch:
+                self.refresher.refresh()
+            
+            results = self.search_index.search(query, sources, category, since, until, limit)
+            articles = [dict(article, score=score) for score, article in results]
+            
+            return {
+                'success': True,
+                'query': query,
+                'articles': articles,
+                'total_results': len(articles)
+            }
+            
+        except Exception as e:
+            logger.error(f"Error searching news: {e}")
+            return {'success': False, 'error': str(e)}
+    
+    def start_background_tasks(self):
+        """
+        Start the feed refresher, and the prefetch pipeline when enabled.
+        
+        Models only warm up here for prefetch; otherwise the model endpoints
+        start them, so feed- and search-only processes stay light.
+        """
+        self.refresher.start()
+        if PREFETCH_ENABLED:
+            self.warmup.start()
+            self.prefetch.start()
+    
+    def _on_refresh(self, articles, last_fetch):
+        """Queue the new snapshot's unseen articles for prefetch."""
+        if PREFETCH_ENABLED:
+            self.prefetch.submit(articles)
+    
+    def get_archive(self, sources=None, category=None, cursor=None, limit=ARCHIVE_PAGE_SIZE):
+        """Page through archived articles, newest first."""
+        articles, next_cursor = self.archive.page(sources, category, cursor, limit)
+        return {
+            'success': True,
+            'articles': articles,
+            'next_cursor': next_cursor,
+            'total_articles': len(articles)
+        }
+    
     def summarize_article(self, article_text, article_url=None):
         """Summarize an article with caching."""
         try:
-            # Create cache key
-            cache_key = hashlib.md5(article_text.encode()).hexdigest()
-            cache_file = os.path.join(CACHE_DIR, f'summary_{cache_key}.json')
-            
             # Check cache
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    return {
-                        'success': True,
-                        'summary': cached_data['summary'],
-                        'cached': True
-                    }
+            summary = self._get_cached_summary(article_text)
+            if summary is not None:
+                self._attach_summary(article_url, summary)
+                return {
+                    'success': True,
+                    'summary': summary,
+                    'cached': True
+                }
             
-            # Generate new summary
-            logger.info("Generating new summary...")
-            summary = self.summarizer.summarize(article_text)
+            # While the model warms up, answer with an extractive summary instead of stalling
+            self.warmup.start()
+            if not self.warmup.is_ready('summarizer'):
+                return {
+                    'success': True,
+                    'summary': self.summarizer.extractive_summary(article_text),
+                    'cached': False,
+                    'extractive': True,
+                    'model_status': self.warmup.status('summarizer')
+                }
             
-            # Cache the result
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'summary': summary,
-                    'timestamp': datetime.now().isoformat(),
-                    'url': article_url
-                }, f, indent=2, ensure_ascii=False)
+            # Generate new summary, sharing one run between identical concurrent requests
+            summary, shared = self.summary_flight.do(
+                self._summary_cache_key(article_text),
+                self._generate_summary, article_text, article_url
+            )
+            self._attach_summary(article_url, summary)
             
             return {
                 'success': True,
                 'summary': summary,
-                'cached': False
+                'cached': shared
             }
             
         except Exception as e:
             logger.error(f"Error summarizing article: {e}")
             return {'success': False, 'error': str(e)}
     
-    def synthesize_voice(self, text, voice_name='morgan_freeman', article_id=None):
-        """Synthesize voice audio with caching."""
+    def _attach_summary(self, article_url, summary):
+        """Serve and index an on-demand summary with its article, if that is still fetched."""
+        if not article_url:
+            return
+        article = self.refresher.store.find_by_link(article_url)
+        if article is not None:
+            self.refresher.store.add_summaries({article['id']: summary})
+    
+    def _generate_summary(self, article_text, article_url=None):
+        """Run the summarizer and cache the result (single-flight leader only)."""
+        # A previous flight may have finished between the cache check and now
+        summary = self._get_cached_summary(article_text)
+        if summary is not None:
+            return summary
+        
+        logger.info("Generating new summary...")
+        summary = self.summarizer.summarize(article_text)
+        self._cache_summary(article_text, summary, article_url)
+        return summary
+    
+    def summarize_articles(self, articles):
+        """
+        Summarize several fetched articles, batching the cache misses.
+        
+        Returns:
+            Dictionary mapping article ID to its summary
+        """
+        summaries = {}
+        missing = []
+        
+        for article in articles:
+            summary = self._get_cached_summary(get_article_text(article))
+            if summary is not None:
+                summaries[article['id']] = summary
+            else:
+                missing.append(article)
+        
+        if missing and self.warmup.wait('summarizer'):
+            logger.info(f"Batch summarizing {len(missing)} articles...")
+            texts = [get_article_text(article) for article in missing]
+            for article, text, summary in zip(missing, texts, self.summarizer.batch_summarize(texts)):
+                self._cache_summary(text, summary, article.get('link'))
+                summaries[article['id']] = summary
+        
+        # Served with the articles, so clients request audio for the prefetched text
+        self.refresher.store.add_summaries(summaries)
+        
+        return summaries
+    
+    def _summary_cache_key(self, article_text):
+        return hashlib.md5(article_text.encode()).hexdigest()
+    
+    def _get_cached_summary(self, article_text):
+        """Return the cached summary for a text, or None."""
+        return self.summary_store.get(self._summary_cache_key(article_text))
+    
+    def _cache_summary(self, article_text, summary, article_url=None):
+        """Store a summary in the cache."""
+        self.summary_store.put(self._summary_cache_key(article_text), summary, article_url)
+    
+    def synthesize_voice(self, text, voice_name=DEFAULT_VOICE, article_id=None, track_usage=True, wait=False):
+        """
+        Synthesize voice audio with caching.
+        
+        Until the TTS model has warmed up, cache misses fail fast with the
+        model status, unless `wait` is set (background callers).
+        """
         try:
-            # Create cache key
-            text_hash = hashlib.md5(text.encode()).hexdigest()
-            cache_key = f"{voice_name}_{text_hash}"
-            audio_file = os.path.join(AUDIO_DIR, f"{cache_key}.wav")
+            if track_usage:
+                self._track_voice(voice_name)
+            
+            cache_key = self._audio_cache_key(text, voice_name)
             
             # Check if audio already exists
-            if os.path.exists(audio_file):
+            if self.audio_cache.lookup(f"{cache_key}.wav"):
                 return {
                     'success': True,
                     'audio_file': f"audio/{cache_key}.wav",
                     'cached': True
                 }
             
-            # Generate new audio
-            logger.info(f"Generating voice audio with {voice_name}...")
-            success = self.voice_synthesizer.synthesize(text, voice_name, audio_file)
+            self.warmup.start()
+            if not self.warmup.is_ready('voice_synthesizer'):
+                if not (wait and self.warmup.wait('voice_synthesizer')):
+                    status = self.warmup.status('voice_synthesizer')
+                    return {
+                        'success': False,
+                        'status': status,
+                        'error': 'Voice model failed to load' if status == 'failed'
+                                 else 'Voice model is not ready yet, try again shortly'
+                    }
+            
+            # Generate new audio, sharing one run between identical concurrent requests
+            success, shared = self.audio_flight.do(
+                cache_key,
+                self._generate_audio, text, voice_name, cache_key
+            )
             
             if success:
                 return {
                     'success': True,
                     'audio_file': f"audio/{cache_key}.wav",
-                    'cached': False
+                    'cached': shared
                 }
             else:
                 return {'success': False, 'error': 'Voice synthesis failed'}
@@ -141,6 +356,92 @@ class NewsBreeze:
             logger.error(f"Error synthesizing voice: {e}")
             return {'success': False, 'error': str(e)}
     
+    def is_audio_cached(self, text, voice_name=DEFAULT_VOICE, streamed=False):
+        return self.audio_cache.lookup(f"{self._audio_cache_key(text, voice_name, streamed)}.wav")
+    
+    def stream_voice(self, text, voice_name=DEFAULT_VOICE):
+        """
+        Yield a WAV stream as the text is synthesized sentence by sentence.
+        
+        A cached clip is streamed straight from disk. Otherwise the header is
+        sent first (with unknown length) followed by PCM for each chunk as it
+        is produced; once the stream completes the full clip is cached.
+        """
+        self._track_voice(voice_name)
+        cache_key = self._audio_cache_key(text, voice_name, streamed=True)
+        filename = f"{cache_key}.wav"
+        
+        if self.audio_cache.lookup(filename):
+            with open(os.path.join(AUDIO_DIR, filename), 'rb') as f:
+                while True:
+                    block = f.read(64 * 1024)
+                    if not block:
+                        return
+                    yield block
+        
+        logger.info(f"Streaming voice audio with {voice_name}...")
+        sample_rate = None
+        pcm_chunks = []
+        
+        for waveform in self.voice_synthesizer.synthesize_stream(text, voice_name):
+            if sample_rate is None:
+                sample_rate = self.voice_synthesizer.output_sample_rate
+                yield wav_header(sample_rate)
+            pcm = to_pcm16(waveform)
+            pcm_chunks.append(pcm)
+            yield pcm
+        
+        # Only reached when the client consumed the whole stream
+        if pcm_chunks:
+            write_wav(os.path.join(AUDIO_DIR, filename), b''.join(pcm_chunks), sample_rate)
+            self.audio_cache.add(filename)
+    
+    def submit_synthesis(self, text, voice_name=DEFAULT_VOICE, article_id=None):
+        """
+        Queue voice synthesis on the job pool.
+        
+        Returns:
+            The job dictionary (already done on a cache hit), or None if the
+            job queue is full
+        """
+        cache_key = self._audio_cache_key(text, voice_name)
+        if self.audio_cache.lookup(f"{cache_key}.wav"):
+            self._track_voice(voice_name)
+            return self.synthesis_jobs.complete(f"audio/{cache_key}.wav", voice_name, article_id)
+        
+        return self.synthesis_jobs.submit(cache_key, text, voice_name, article_id)
+    
+    def _audio_cache_key(self, text, voice_name, streamed=False):
+        """
+        Cache key of a clip. Streamed clips read the whole text without
+        crossfades, unlike synthesize_voice's truncated ones, so they are
+        cached separately.
+        """
+        text_hash = hashlib.md5(text.encode()).hexdigest()
+        return f"{voice_name}_{text_hash}_full" if streamed else f"{voice_name}_{text_hash}"
+    
+    def _track_voice(self, voice_name):
+        with self._voice_usage_lock:
+            self.voice_usage[voice_name] += 1
+    
+    def _generate_audio(self, text, voice_name, cache_key):
+        """Run the synthesizer and register the file (single-flight leader only)."""
+        filename = f"{cache_key}.wav"
+        if self.audio_cache.lookup(filename):
+            return True
+        
+        logger.info(f"Generating voice audio with {voice_name}...")
+        success = self.voice_synthesizer.synthesize(text, voice_name, os.path.join(AUDIO_DIR, filename))
+        if success:
+            self.audio_cache.add(filename)
+        return success
+    
+    def get_popular_voices(self, limit=1):
+        """Most requested voices, falling back to the default voice."""
+        with self._voice_usage_lock:
+            voices = [voice for voice, _ in self.voice_usage.most_common(limit)]
+        return voices or [DEFAULT_VOICE]
+    
     def get_available_voices(self):
         """Get list of available voice models."""
         return self.voice_synthesizer.get_available_voices()
@@ -149,8 +450,50 @@ class NewsBreeze:
         """Get list of available news sources."""
         return self.news_fetcher.get_sources()
 
+def _peak_rss_mb():
+    """Peak resident memory of this process in MB, if the platform reports it."""
+    try:
+        import resource
+        import sys
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux reports KB, macOS reports bytes
+        return round(peak / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+    except (ImportError, AttributeError):
+        return None
+
 # Initialize NewsBreeze service
-newsbreeze = NewsBreeze()
+_newsbreeze = None
+_newsbreeze_lock = threading.Lock()
+STARTUP_SECONDS = None
+
+def get_newsbreeze():
+    """
+    Return the NewsBreeze service, creating it if it was not built at import.
+    
+    Model worker processes (spawned, see model_workers.py) re-import this
+    module; they must not build a second service with its own caches,
+    stores and refresher, so they never call this.
+    """
+    global _newsbreeze, STARTUP_SECONDS
+    if _newsbreeze is None:
+        with _newsbreeze_lock:
+            if _newsbreeze is None:
+                _newsbreeze = NewsBreeze()
+                STARTUP_SECONDS = round(time.perf_counter() - _start_time, 3)
+                logger.info(f"NewsBreeze initialized in {STARTUP_SECONDS:.3f}s (peak RSS: {_peak_rss_mb()} MB)")
+    return _newsbreeze
+
+newsbreeze = LocalProxy(get_newsbreeze)
+
+def _is_service_process():
+    """False in spawned model workers and in the debug reloader's watcher process."""
+    if __name__ == '__mp_main__' or multiprocessing.parent_process() is not None:
+        return False
+    return __name__ != '__main__' or os.environ.get('WERKZEUG_RUN_MAIN') == 'true'
+
+# Build the service at startup, so the first request doesn't pay for it
+if _is_service_process():
+    get_newsbreeze()
 
 @app.route('/')
 def index():
@@ -159,14 +502,125 @@ def index():
 
 @app.route('/api/news')
 def get_news():
-    """Get news articles."""
+    """
+    Get news articles.
+    
+    Query parameters: sources (repeatable), category, refresh, limit,
+    cursor (the next_cursor of the previous page) and fields (comma
+    separated, e.g. fields=id,title,source).
+    
+    Responses are serialized once per snapshot and reused until the next
+    refresh; they carry an ETag and are compressed when the client allows.
+    """
     sources = request.args.getlist('sources')
     category = request.args.get('category')
     force_refresh = request.args.get('refresh', 'false').lower() == 'true'
+    cursor = request.args.get('cursor')
+    limit = max(1, min(request.args.get('limit', MAX_NEWS_ARTICLES, type=int), MAX_NEWS_ARTICLES))
+    fields = sorted({f.strip() for f in request.args.get('fields', '').split(',') if f.strip()})
+    
+    key = (tuple(sorted(sources)), category, cursor, limit, tuple(fields))
+    store = newsbreeze.refresher.store
+    entry = None
+    if not force_refresh and newsbreeze.refresher.last_fetch:
+        entry = newsbreeze.news_responses.get(key, store.version)
+    
+    if entry is None:
+        # Read the version first, so a refresh during the query can't be cached as current
+        version = store.version
+        try:
+            result = newsbreeze.get_news(sources, category, force_refresh, cursor, limit, fields)
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+        if not result['success']:
+            return jsonify(result)
+        # last_updated moves on every refresh, so the ETag only covers the articles
+        content = {k: v for k, v in result.items() if k != 'last_updated'}
+        etag = hashlib.md5(app.json.dumps(content).encode('utf-8')).hexdigest()
+        entry = newsbreeze.news_responses.put(key, version, f"{app.json.dumps(result)}\n".encode('utf-8'), etag)
+    
+    return _cached_json_response(entry)
+
+def _cached_json_response(entry):
+    """Serve a CachedResponse with content negotiation and conditional GET."""
+    encoding = None
+    if len(entry.body) >= COMPRESS_MIN_BYTES:
+        encoding = request.accept_encodings.best_match(entry.encodings)
+    
+    response = Response(entry.encoded(encoding), mimetype='application/json')
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    # Weak, since the same ETag covers every content coding of the body
+    response.set_etag(entry.etag, weak=True)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def _parse_date_arg(name):
+    """Parse an ISO 8601 date query parameter into a naive UTC datetime (None if absent)."""
+    value = request.args.get(name)
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+@app.route('/api/archive')
+def get_archive():
+    """
+    Page through all archived articles, newest first.
+    
+    Query parameters: sources (repeatable), category, limit, and cursor
+    (the next_cursor of the previous page).
+    """
+    limit = max(1, min(request.args.get('limit', ARCHIVE_PAGE_SIZE, type=int), 200))
+    try:
+        result = newsbreeze.get_archive(
+            sources=request.args.getlist('sources'),
+            category=request.args.get('category'),
+            cursor=request.args.get('cursor'),
+            limit=limit
+        )
+    except ValueError as e:
+        return jsonify({'success': False, 'error': str(e)}), 400
+    return jsonify(result)
+
+@app.route('/api/search')
+def search_news():
+    """
+    Search fetched articles.
+    
+    Query parameters: q (required; the last word matches as a prefix),
+    sources (repeatable), category, since/until (ISO 8601 dates), limit.
+    """
+    query = request.args.get('q', '').strip()
+    if not query:
+        return jsonify({'success': False, 'error': 'No query provided'}), 400
+    
+    try:
+        since = _parse_date_arg('since')
+        until = _parse_date_arg('until')
+    except ValueError:
+        return jsonify({'success': False, 'error': 'Invalid date, expected ISO 8601 (e.g. 2024-05-01)'}), 400
     
-    result = newsbreeze.get_news(sources, category, force_refresh)
+    limit = max(1, min(request.args.get('limit', SEARCH_RESULTS_LIMIT, type=int), 100))
+    result = newsbreeze.search_news(
+        query,
+        sources=request.args.getlist('sources'),
+        category=request.args.get('category'),
+        since=since,
+        until=until,
+        limit=limit
+    )
     return jsonify(result)
 
+@app.route('/api/search/suggest')
+def search_suggest():
+    """Autocomplete the word being typed from indexed article terms."""
+    suggestions = newsbreeze.search_index.suggest(request.args.get('q', ''))
+    return jsonify({'success': True, 'suggestions': suggestions})
+
 @app.route('/api/summarize', methods=['POST'])
 def summarize():
     """Summarize article text."""
@@ -191,19 +645,87 @@ def synthesize():
     try:
         data = request.get_json()
         text = data.get('text', '')
-        voice_name = data.get('voice', 'morgan_freeman')
+        voice_name = data.get('voice', DEFAULT_VOICE)
         article_id = data.get('article_id')
         
         if not text.strip():
             return jsonify({'success': False, 'error': 'No text provided'})
         
+        if data.get('async'):
+            return _submit_synthesis_job(text, voice_name, article_id)
+        
         result = newsbreeze.synthesize_voice(text, voice_name, article_id)
+        if result.get('status') in ('pending', 'loading'):
+            return jsonify(result), 503, {'Retry-After': '5'}
         return jsonify(result)
         
     except Exception as e:
         logger.error(f"Error in synthesize endpoint: {e}")
         return jsonify({'success': False, 'error': str(e)})
 
+@app.route('/api/synthesize/stream', methods=['GET', 'POST'])
+def synthesize_stream():
+    """Stream voice audio as it is synthesized (GET works as an <audio> src)."""
+    data = request.get_json(silent=True) or request.args
+    text = data.get('text', '')
+    voice_name = data.get('voice', DEFAULT_VOICE)
+    
+    if not text.strip():
+        return jsonify({'success': False, 'error': 'No text provided'}), 400
+    
+    newsbreeze.warmup.start()
+    if not (newsbreeze.warmup.is_ready('voice_synthesizer') or newsbreeze.is_audio_cached(text, voice_name, streamed=True)):
+        status = newsbreeze.warmup.status('voice_synthesizer')
+        if status == 'failed':
+            return jsonify({'success': False, 'status': status, 'error': 'Voice model failed to load'}), 500
+        return jsonify({
+            'success': False,
+            'status': status,
+            'error': 'Voice model is not ready yet, try again shortly'
+        }), 503, {'Retry-After': '5'}
+    
+    return Response(
+        stream_with_context(newsbreeze.stream_voice(text, voice_name)),
+        mimetype='audio/wav',
+        headers={'Cache-Control': 'no-store'}
+    )
+
+@app.route('/api/synthesize/jobs', methods=['POST'])
+def create_synthesis_job():
+    """Queue voice synthesis and return a job ID immediately."""
+    try:
+        data = request.get_json()
+        text = data.get('text', '')
+        voice_name = data.get('voice', DEFAULT_VOICE)
+        article_id = data.get('article_id')
+        
+        if not text.strip():
+            return jsonify({'success': False, 'error': 'No text provided'})
+        
+        return _submit_synthesis_job(text, voice_name, article_id)
+        
+    except Exception as e:
+        logger.error(f"Error in synthesis job endpoint: {e}")
+        return jsonify({'success': False, 'error': str(e)})
+
+@app.route('/api/synthesize/jobs/<job_id>')
+def get_synthesis_job(job_id):
+    """Report the status of a synthesis job."""
+    job = newsbreeze.synthesis_jobs.get(job_id)
+    if not job:
+        return jsonify({'success': False, 'error': 'Job not found'}), 404
+    return jsonify({'success': True, **job})
+
+def _submit_synthesis_job(text, voice_name, article_id):
+    """Queue a synthesis job and build the 202/429 response."""
+    job = newsbreeze.submit_synthesis(text, voice_name, article_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Too many pending synthesis jobs, try again later'}), 429
+    
+    job['status_url'] = f"/api/synthesize/jobs/{job['job_id']}"
+    status_code = 200 if job['status'] == 'done' else 202
+    return jsonify({'success': True, **job}), status_code
+
 @app.route('/api/voices')
 def get_voices():
     """Get available voice models."""
@@ -218,17 +740,72 @@ def get_sources():
 
 @app.route('/audio/<filename>')
 def serve_audio(filename):
-    """Serve audio files."""
+    """
+    Serve audio files in the negotiated format.
+    
+    The format comes from ?format=, a non-WAV extension in the URL, the
+    Accept header, or DEFAULT_AUDIO_FORMAT, in that order. Encodings are
+    produced on first request and cached next to the WAV.
+    """
     try:
-        audio_path = os.path.join(AUDIO_DIR, filename)
-        if os.path.exists(audio_path):
-            return send_file(audio_path, mimetype='audio/wav')
+        base, ext = os.path.splitext(filename)
+        requested = request.args.get('format') or (ext[1:] if ext != '.wav' else None)
+        fmt = newsbreeze.transcoder.negotiate(requested, request.accept_mimetypes)
+        
+        served = newsbreeze.transcoder.get(f"{base}.wav", fmt)
+        if served is None and fmt != 'wav':
+            # Encoding unavailable, fall back to the WAV itself
+            fmt = 'wav'
+            served = newsbreeze.transcoder.get(f"{base}.wav", fmt)
+        
+        if served:
+            return _audio_response(served, fmt)
         else:
             return jsonify({'error': 'Audio file not found'}), 404
     except Exception as e:
         logger.error(f"Error serving audio: {e}")
         return jsonify({'error': str(e)}), 500
 
+def _audio_response(filename, fmt):
+    """
+    Build the response for a cached audio file.
+    
+    Filenames are content hashes, so the ETag is derived from the name and
+    the response is cacheable forever. send_file handles If-None-Match (304)
+    and byte ranges; with AUDIO_ACCEL_REDIRECT_PREFIX set the body is left
+    to nginx instead.
+    """
+    etag = os.path.splitext(filename)[0] + '-' + fmt
+    
+    if AUDIO_ACCEL_REDIRECT_PREFIX:
+        response = Response(mimetype=AUDIO_MIMETYPES[fmt])
+        response.headers['X-Accel-Redirect'] = AUDIO_ACCEL_REDIRECT_PREFIX + filename
+        response.set_etag(etag)
+        response.make_conditional(request)
+    else:
+        response = send_file(
+            os.path.join(AUDIO_DIR, filename),
+            mimetype=AUDIO_MIMETYPES[fmt],
+            etag=etag,
+            conditional=True,
+            max_age=AUDIO_CACHE_MAX_AGE
+        )
+    
+    response.cache_control.public = True
+    response.cache_control.max_age = AUDIO_CACHE_MAX_AGE
+    response.cache_control.immutable = True
+    response.vary.add('Accept')
+    return response
+
+@app.route('/api/cache/stats')
+def cache_stats():
+    """Summary and audio cache statistics."""
+    return jsonify({
+        'summaries': newsbreeze.summary_store.get_stats(),
+        'audio': newsbreeze.audio_cache.get_stats(),
+        'segments': newsbreeze.voice_synthesizer.segment_cache.get_stats()
+    })
+
 @app.route('/api/health')
 def health_check():
     """Health check endpoint."""
@@ -241,8 +818,15 @@ def health_check():
             'status': 'healthy',
             'summarizer_ready': summarizer_ready,
             'voice_synthesizer_ready': voice_ready,
+            'models': newsbreeze.warmup.get_status(),
             'available_voices': len(newsbreeze.get_available_voices()),
-            'cached_articles': len(newsbreeze.cached_news)
+            'cached_articles': len(newsbreeze.cached_news),
+            'startup_seconds': STARTUP_SECONDS,
+            'peak_rss_mb': _peak_rss_mb(),
+            'prefetch': newsbreeze.prefetch.get_stats(),
+            'summary_cache': newsbreeze.summary_store.get_stats(),
+            'audio_cache': newsbreeze.audio_cache.get_stats(),
+            'synthesis_jobs': newsbreeze.synthesis_jobs.get_stats()
         })
     except Exception as e:
         return jsonify({
@@ -253,14 +837,11 @@ def health_check():
 if __name__ == '__main__':
     logger.info("Starting NewsBreeze application...")
     
-    # Initialize models in background
-    try:
-        logger.info("Initializing AI models...")
-        newsbreeze.summarizer.load_model()
-        newsbreeze.voice_synthesizer.load_model()
-        logger.info("✅ Models loaded successfully")
-    except Exception as e:
-        logger.warning(f"⚠️  Model loading failed: {e}")
-        logger.info("Models will be loaded on first use")
+    # The debug reloader runs this script in a watcher process and again in the
+    # child that serves requests; only the child runs the refresher, prefetch and models
+    if os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        # Models load on background threads; /api/health reports their progress
+        get_newsbreeze().start_background_tasks()
+        get_newsbreeze().warmup.start()
     
     app.run(debug=True, host='0.0.0.0', port=5000)
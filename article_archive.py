@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Article Archive for NewsBreeze - SQLite history of every fetched article.
+"""
+
+import base64
+import json
+import sqlite3
+import threading
+import time
+import logging
+from datetime import datetime, timedelta
+from config import ARCHIVE_RETENTION_DAYS
+
+logger = logging.getLogger(__name__)
+
+def _date_key(published_date):
+    """Sortable text form of a publication date."""
+    if isinstance(published_date, datetime):
+        return published_date.isoformat(timespec='microseconds')
+    return published_date or ''
+
+def encode_cursor(article):
+    """Opaque pagination cursor pointing just past `article`."""
+    raw = f"{_date_key(article.get('published_date'))}|{article['id']}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip('=')
+
+def decode_cursor(cursor):
+    """
+    Split a cursor from encode_cursor() into (date key, article ID).
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4)).decode()
+    except Exception:
+        raise ValueError("Invalid cursor")
+    date_key, sep, article_id = raw.rpartition('|')
+    if not sep or not article_id:
+        raise ValueError("Invalid cursor")
+    return date_key, article_id
+
+def _serialize(article):
+    data = dict(article)
+    data.pop('alternates', None)
+    if isinstance(data.get('published_date'), datetime):
+        data['published_date'] = data['published_date'].isoformat()
+    return json.dumps(data, ensure_ascii=False, default=str)
+
+def _deserialize(data):
+    article = json.loads(data)
+    if article.get('published_date'):
+        try:
+            article['published_date'] = datetime.fromisoformat(article['published_date'])
+        except ValueError:
+            pass
+    return article
+
+class ArticleArchive:
+    """
+    Append-only store of fetched articles.
+
+    Each article is written once, keyed by its ID; the IDs already stored
+    are kept in memory, so a refresh only serializes articles that are new.
+    Indexes on publication date, source and category serve warm starts and
+    keyset pagination. Articles older than `retention_days` are pruned.
+    """
+
+    def __init__(self, db_path, retention_days=ARCHIVE_RETENTION_DAYS):
+        self.db_path = db_path
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS articles (
+                id TEXT PRIMARY KEY,
+                source TEXT,
+                category TEXT,
+                published_date TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                data TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_published ON articles(published_date, id)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_source ON articles(source, published_date)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_articles_category ON articles(category, published_date)")
+
+        self._known_ids = {row[0] for row in self._conn.execute("SELECT id FROM articles")}
+
+    def ingest(self, articles):
+        """
+        Store articles whose IDs have not been archived yet.
+
+        Returns:
+            Number of new articles written
+        """
+        now = time.time()
+        cutoff = _date_key(datetime.now() - timedelta(days=self.retention_days))
+        with self._lock:
+            rows = []
+            for article in articles:
+                # Articles past retention would only be pruned again right away
+                date_key = _date_key(article.get('published_date'))
+                if article['id'] in self._known_ids or date_key < cutoff:
+                    continue
+                self._known_ids.add(article['id'])
+                rows.append((
+                    article['id'],
+                    article.get('source'),
+                    article.get('category'),
+                    date_key,
+                    now,
+                    _serialize(article)
+                ))
+
+            if not rows:
+                return 0
+
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO articles (id, source, category, published_date, fetched_at, data) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+                expired = [row[0] for row in self._conn.execute(
+                    "SELECT id FROM articles WHERE published_date < ?", (cutoff,)
+                )]
+                self._conn.execute("DELETE FROM articles WHERE published_date < ?", (cutoff,))
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                self._known_ids.difference_update(row[0] for row in rows)
+                raise
+
+            self._known_ids.difference_update(expired)
+            pruned = len(expired)
+
+        logger.info(f"Archived {len(rows)} new articles" + (f", pruned {pruned} old ones" if pruned else ""))
+        return len(rows)
+
+    def latest_by_source(self, per_source):
+        """
+        Newest archived articles of every source, for warm starts.
+
+        Returns:
+            Dictionary mapping source name to its articles, newest first
+        """
+        with self._lock:
+            rows = self._conn.execute("""
+                SELECT source, data FROM (
+                    SELECT source, data, published_date,
+                           ROW_NUMBER() OVER (PARTITION BY source ORDER BY published_date DESC, id DESC) AS position
+                    FROM articles
+                )
+                WHERE position <= ?
+                ORDER BY source, published_date DESC
+            """, (per_source,)).fetchall()
+
+        results = {}
+        for source_name, data in rows:
+            results.setdefault(source_name, []).append(_deserialize(data))
+        return results
+
+    def last_fetched(self):
+        """When the newest article was archived, or None for an empty archive."""
+        with self._lock:
+            fetched_at = self._conn.execute("SELECT MAX(fetched_at) FROM articles").fetchone()[0]
+        return datetime.fromtimestamp(fetched_at) if fetched_at else None
+
+    def page(self, sources=None, category=None, cursor=None, limit=50):
+        """
+        One page of history, newest first.
+
+        Args:
+            sources: List of source names to include (all if empty)
+            category: Only include articles of this category
+            cursor: Cursor from the previous page, or None for the first page
+            limit: Articles per page
+
+        Returns:
+            (articles, cursor for the next page or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        clauses, params = [], []
+        if sources:
+            clauses.append(f"source IN ({', '.join('?' * len(sources))})")
+            params.extend(sources)
+        if category:
+            clauses.append("category = ?")
+            params.append(category)
+        if cursor:
+            date_key, article_id = decode_cursor(cursor)
+            clauses.append("(published_date < ? OR (published_date = ? AND id < ?))")
+            params.extend([date_key, date_key, article_id])
+
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM articles {where} ORDER BY published_date DESC, id DESC LIMIT ?",
+                params + [limit + 1]
+            ).fetchall()
+
+        articles = [_deserialize(data) for (data,) in rows[:limit]]
+        next_cursor = encode_cursor(articles[-1]) if len(rows) > limit else None
+        return articles, next_cursor
+
+    def get_stats(self):
+        """Archived article count and date range."""
+        with self._lock:
+            count, oldest, newest = self._conn.execute(
+                "SELECT COUNT(*), MIN(published_date), MAX(published_date) FROM articles"
+            ).fetchone()
+        return {'articles': count, 'oldest': oldest, 'newest': newest}
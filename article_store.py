@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+Article Store for NewsBreeze - in-memory articles keyed by source.
+"""
+
+import heapq
+import threading
+import logging
+from datetime import datetime
+from itertools import dropwhile, islice
+
+logger = logging.getLogger(__name__)
+
+def _sort_key(article):
+    # The ID breaks ties, so every article has a unique position for cursors
+    return (article.get('published_date') or datetime.min, article['id'])
+
+class ArticleStore:
+    """
+    Holds the latest fetched articles of every source.
+
+    Each source's list is kept sorted newest first and replaced as a whole,
+    so readers always see a consistent view without taking the lock.
+    Source/category filters are applied at query time, so every request is
+    served from the same fetched set.
+
+    With a deduplicator, copies of the same story from several sources are
+    grouped: the canonical article lists the others under 'alternates' and
+    queries return only the canonical one.
+
+    Generated summaries are attached to their articles as 'summary' and
+    kept across refreshes while the article's description is unchanged.
+
+    With a search index, every update is mirrored into it.
+    """
+
+    def __init__(self, deduplicator=None, index=None):
+        self.deduplicator = deduplicator
+        self.index = index
+        self._by_source = {}
+        self._by_id = {}
+        self._duplicates = {}
+        # source name -> articles as last fetched, to detect unchanged refreshes
+        self._fetched = {}
+        # article ID -> (description it was generated from, summary)
+        self._summaries = {}
+        self._lock = threading.Lock()
+        # Incremented whenever the articles change, so derived data knows when it is stale
+        self.version = 0
+
+    def update(self, results):
+        """
+        Replace the articles of the given sources.
+
+        Sources whose articles are unchanged (e.g. their feed answered 304)
+        are skipped; if none changed, the version stays the same.
+
+        Args:
+            results: Dictionary mapping source name to its list of articles
+        """
+        with self._lock:
+            changed = {}
+            for source_name, articles in results.items():
+                articles = tuple(sorted(articles, key=_sort_key, reverse=True))
+                if self._fetched.get(source_name) != articles:
+                    changed[source_name] = articles
+            if not changed:
+                return
+            self._fetched.update(changed)
+
+            by_source = dict(self._by_source)
+            by_source.update(changed)
+
+            duplicates = {}
+            if self.deduplicator:
+                by_source, duplicates = self._deduplicate(by_source)
+
+            by_source = self._attach_summaries(by_source)
+            by_id = self._index_by_id(by_source)
+            self._summaries = {k: v for k, v in self._summaries.items() if k in by_id}
+
+            self._by_source = by_source
+            self._by_id = by_id
+            self._duplicates = duplicates
+            self.version += 1
+
+            if self.index is not None:
+                self.index.update(by_id.values(), duplicates)
+
+    def add_summaries(self, summaries):
+        """
+        Attach generated summaries to the stored articles.
+
+        Args:
+            summaries: Dictionary mapping article ID to its summary
+        """
+        with self._lock:
+            changed = {}
+            for article_id, summary in summaries.items():
+                article = self._by_id.get(article_id)
+                if article is None or article.get('summary') == summary:
+                    continue
+                self._summaries[article_id] = (article.get('description'), summary)
+                changed[article_id] = summary
+            if not changed:
+                return
+
+            by_source = self._attach_summaries(self._by_source, changed)
+            self._by_source = by_source
+            self._by_id = self._index_by_id(by_source)
+            self.version += 1
+
+            if self.index is not None:
+                for article_id, summary in changed.items():
+                    self.index.add_summary(article_id, summary)
+
+    def _attach_summaries(self, by_source, only=None):
+        """Copy of by_source with known summaries set on their articles (only IDs in `only`, if given)."""
+        def with_summary(article):
+            entry = self._summaries.get(article['id'])
+            if entry is None or entry[0] != article.get('description') or article.get('summary') == entry[1]:
+                return article
+            # Stored articles are shared with readers, so copy instead of mutating
+            return dict(article, summary=entry[1])
+
+        return {
+            source_name: tuple(with_summary(a) for a in articles)
+            if only is None or any(a['id'] in only for a in articles) else articles
+            for source_name, articles in by_source.items()
+        }
+
+    @staticmethod
+    def _index_by_id(by_source):
+        by_id = {}
+        for articles in by_source.values():
+            for article in articles:
+                by_id[article['id']] = article
+        return by_id
+
+    def _deduplicate(self, by_source):
+        """
+        Cluster the articles of all sources into stories.
+
+        The article with the longest description (then the newest) is the
+        canonical one, since it gives the summarizer the most to work with.
+
+        Returns:
+            (by_source with 'alternates' set on canonical articles,
+             dictionary mapping each duplicate's ID to its canonical article)
+        """
+        articles = [article for source_articles in by_source.values() for article in source_articles]
+        clusters = self.deduplicator.cluster(articles)
+
+        alternates = {}
+        duplicates = {}
+        for members in clusters:
+            group = [articles[i] for i in members]
+            canonical = max(group, key=lambda a: (len(a.get('description') or ''), _sort_key(a)))
+            others = [a for a in group if a is not canonical]
+            alternates[canonical['id']] = [
+                {'id': a['id'], 'source': a.get('source'), 'title': a.get('title'), 'link': a.get('link')}
+                for a in others
+            ]
+            for article in others:
+                duplicates[article['id']] = canonical
+
+        if clusters:
+            logger.info(f"Grouped {len(duplicates) + len(clusters)} articles into {len(clusters)} stories")
+
+        def with_alternates(article):
+            # Stored articles are shared with readers, so copy instead of mutating
+            if article['id'] in alternates:
+                return dict(article, alternates=alternates[article['id']])
+            if 'alternates' in article:
+                return {k: v for k, v in article.items() if k != 'alternates'}
+            return article
+
+        by_source = {
+            source_name: tuple(with_alternates(a) for a in source_articles)
+            for source_name, source_articles in by_source.items()
+        }
+        return by_source, duplicates
+
+    def query(self, sources=None, category=None, limit=None, after=None):
+        """
+        Return articles newest first, filtered in memory.
+
+        Args:
+            sources: List of source names to include (all if empty)
+            category: Only include articles of this category
+            limit: Maximum number of articles to return
+            after: (published_date, id) position; only older articles are returned
+
+        Returns:
+            List of article dictionaries
+        """
+        by_source = self._by_source
+        if sources:
+            lists = [by_source[name] for name in sources if name in by_source]
+        else:
+            lists = list(by_source.values())
+
+        articles = heapq.merge(*lists, key=_sort_key, reverse=True)
+        if after is not None:
+            articles = dropwhile(lambda a: _sort_key(a) >= after, articles)
+        if category:
+            articles = (a for a in articles if a.get('category') == category)
+
+        duplicates = self._duplicates
+        if duplicates:
+            # A copy is only hidden when its canonical article passes the same filters
+            def is_shown(article):
+                canonical = duplicates.get(article['id'])
+                return canonical is None or not (
+                    (not sources or canonical.get('source') in sources)
+                    and (not category or canonical.get('category') == category)
+                )
+            articles = filter(is_shown, articles)
+
+        return list(islice(articles, limit))
+
+    def get(self, article_id):
+        """Look up a single article by ID."""
+        return self._by_id.get(article_id)
+
+    def find_by_link(self, link):
+        """Look up an article by its link (a scan; for one-off lookups)."""
+        for article in self._by_id.values():
+            if article.get('link') == link:
+                return article
+        return None
+
+    def source_articles(self, source_name):
+        """Current articles of one source."""
+        return self._by_source.get(source_name, ())
+
+    def __len__(self):
+        return len(self._by_id)
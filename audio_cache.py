@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Audio Cache for NewsBreeze - size- and age-bounded management of generated audio files.
+"""
+
+import os
+import threading
+import time
+import logging
+from config import MAX_CACHE_SIZE_MB, CACHE_EXPIRY_HOURS, AUDIO_CACHE_POLICY
+
+logger = logging.getLogger(__name__)
+
+class AudioCache:
+    """
+    Keeps an in-memory index of the files in an audio directory.
+
+    Every file's size, last access time and hit count are tracked in
+    memory. A miss checks the disk once, since another process sharing the
+    directory may have written the file. Hits are also recorded as the
+    file's mtime (at most every TOUCH_INTERVAL seconds), so a process that
+    never serves a file still sees it is in use elsewhere. Files idle for
+    longer than `ttl_hours` are deleted, and when the directory grows past
+    `max_size_mb` files are evicted by LRU or LFU until it is back under
+    the low watermark. Eviction runs when over budget and at least every
+    MAINTENANCE_INTERVAL seconds.
+    """
+
+    LOW_WATERMARK = 0.9  # evict down to this fraction of the budget
+    MAINTENANCE_INTERVAL = 300  # seconds between idle-file expiry passes
+    TOUCH_INTERVAL = 60  # seconds between recording a file's hits on disk
+
+    def __init__(self, directory, max_size_mb=MAX_CACHE_SIZE_MB,
+                 ttl_hours=CACHE_EXPIRY_HOURS, policy=AUDIO_CACHE_POLICY):
+        self.directory = directory
+        self.max_size = max_size_mb * 1024 * 1024
+        self.ttl = ttl_hours * 3600
+        self.policy = policy
+
+        self._entries = {}
+        self._total_size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._next_maintenance = 0
+
+        self.evict()
+        logger.info(f"Audio cache indexed {len(self._entries)} files in {self.directory}")
+
+    def _sync(self):
+        """
+        Reconcile the index with the files on disk.
+
+        Worker processes share the directory, each with its own index, so
+        files written or deleted by the others are picked up here and the
+        size budget applies to the whole directory.
+        """
+        if not os.path.isdir(self.directory):
+            return
+
+        on_disk = {}
+        for entry in os.scandir(self.directory):
+            # Skip files still being written
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                try:
+                    on_disk[entry.name] = entry.stat()
+                except OSError:
+                    continue
+
+        with self._lock:
+            for name in [n for n in self._entries if n not in on_disk]:
+                self._total_size -= self._entries.pop(name)['size']
+
+            for name, stat in on_disk.items():
+                # Accesses by other processes show up as a newer mtime
+                disk_access = max(stat.st_atime, stat.st_mtime)
+                entry = self._entries.get(name)
+                if entry is None:
+                    self._entries[name] = {
+                        'size': stat.st_size,
+                        'last_access': disk_access,
+                        'touched': disk_access,
+                        'hits': 0
+                    }
+                    self._total_size += stat.st_size
+                    continue
+                entry['last_access'] = max(entry['last_access'], disk_access)
+                if entry['size'] != stat.st_size:
+                    self._total_size += stat.st_size - entry['size']
+                    entry['size'] = stat.st_size
+
+    def lookup(self, filename):
+        """Return True if `filename` is cached, recording the access."""
+        self._maybe_maintain()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(filename)
+            if entry is not None:
+                entry['last_access'] = now
+                entry['hits'] += 1
+                self.hits += 1
+                touch = now - entry['touched'] >= self.TOUCH_INTERVAL
+                if touch:
+                    entry['touched'] = now
+        if entry is not None:
+            if touch:
+                self._touch(filename)
+            return True
+
+        # Not indexed here, but another worker process may have written it
+        found = self._register(filename)
+        with self._lock:
+            if found:
+                self._entries[filename]['hits'] += 1
+                self.hits += 1
+            else:
+                self.misses += 1
+        if found:
+            self._touch(filename)
+        return found
+
+    def _touch(self, filename):
+        """Record an access in the file's mtime for the other processes."""
+        try:
+            os.utime(os.path.join(self.directory, filename))
+        except OSError:
+            pass
+
+    def add(self, filename):
+        """Register a newly written file and evict if over budget."""
+        if self._register(filename):
+            with self._lock:
+                over_budget = self._total_size > self.max_size
+            if over_budget:
+                self.evict()
+
+    def _maybe_maintain(self):
+        """Run eviction if the last pass was more than MAINTENANCE_INTERVAL ago."""
+        if time.monotonic() >= self._next_maintenance:
+            self.evict()
+
+    def _register(self, filename):
+        """Index a file that exists on disk. Returns False if it does not."""
+        # Names come from URLs; only plain files directly in the directory count
+        if not filename or os.path.basename(filename) != filename or filename.startswith('.'):
+            return False
+        path = os.path.join(self.directory, filename)
+        try:
+            size = os.path.getsize(path)
+        except OSError:
+            return False
+
+        with self._lock:
+            previous = self._entries.get(filename)
+            if previous:
+                self._total_size -= previous['size']
+            now = time.time()
+            self._entries[filename] = {
+                'size': size,
+                'last_access': now,
+                'touched': now,
+                'hits': previous['hits'] if previous else 0
+            }
+            self._total_size += size
+        return True
+
+    def evict(self):
+        """Resync with the disk, delete idle files, then evict by policy until under the low watermark."""
+        self._next_maintenance = time.monotonic() + self.MAINTENANCE_INTERVAL
+        self._sync()
+        now = time.time()
+        with self._lock:
+            victims = [
+                name for name, entry in self._entries.items()
+                if now - entry['last_access'] > self.ttl
+            ]
+            expired = len(victims)
+
+            remaining = self._total_size - sum(self._entries[name]['size'] for name in victims)
+            if remaining > self.max_size:
+                expired_names = set(victims)
+                if self.policy == 'lfu':
+                    key = lambda name: (self._entries[name]['hits'], self._entries[name]['last_access'])
+                else:
+                    key = lambda name: self._entries[name]['last_access']
+                target = self.max_size * self.LOW_WATERMARK
+                for name in sorted((n for n in self._entries if n not in expired_names), key=key):
+                    if remaining <= target:
+                        break
+                    victims.append(name)
+                    remaining -= self._entries[name]['size']
+
+            for name in victims:
+                entry = self._entries.pop(name)
+                self._total_size -= entry['size']
+            self.evictions += len(victims)
+
+        for name in victims:
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError as e:
+                logger.warning(f"Could not remove cached audio {name}: {e}")
+
+        if victims:
+            logger.info(f"Audio cache evicted {expired} idle and {len(victims) - expired} {self.policy.upper()} files")
+
+    def get_stats(self):
+        """File count, size and hit/eviction counters."""
+        self._maybe_maintain()
+        with self._lock:
+            return {
+                'files': len(self._entries),
+                'size_mb': round(self._total_size / (1024 * 1024), 2),
+                'max_size_mb': round(self.max_size / (1024 * 1024), 2),
+                'policy': self.policy,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Audio Transcoder for NewsBreeze - on-demand Opus/MP3 encodings of cached WAV files.
+"""
+
+import os
+import shutil
+import subprocess
+import logging
+from singleflight import SingleFlight
+from config import AUDIO_FORMATS, AUDIO_BITRATES, DEFAULT_AUDIO_FORMAT
+
+logger = logging.getLogger(__name__)
+
+AUDIO_MIMETYPES = {
+    'wav': 'audio/wav',
+    'mp3': 'audio/mpeg',
+    'opus': 'audio/ogg'
+}
+
+# Accept header types that select a format
+ACCEPT_TYPES = {
+    'audio/ogg': 'opus',
+    'audio/opus': 'opus',
+    'audio/mpeg': 'mp3',
+    'audio/mp3': 'mp3',
+    'audio/wav': 'wav',
+    'audio/x-wav': 'wav'
+}
+
+FFMPEG_CODECS = {
+    'mp3': ['-c:a', 'libmp3lame', '-f', 'mp3'],
+    'opus': ['-c:a', 'libopus', '-application', 'voip', '-f', 'ogg']
+}
+
+class AudioTranscoder:
+    """
+    Encodes cached WAV clips to compressed formats with ffmpeg.
+
+    Each encoding is written next to its WAV (same content-hash name, new
+    extension) and registered with the audio cache, so it is produced once
+    and then served like any other cached file. Concurrent requests for the
+    same encoding share one ffmpeg run.
+    """
+
+    def __init__(self, directory, audio_cache):
+        self.directory = directory
+        self.audio_cache = audio_cache
+        self.ffmpeg = shutil.which('ffmpeg')
+        self._flight = SingleFlight()
+
+        if self.ffmpeg:
+            self.formats = [fmt for fmt in AUDIO_FORMATS if fmt == 'wav' or fmt in FFMPEG_CODECS]
+        else:
+            logger.warning("ffmpeg not found, audio will only be served as WAV")
+            self.formats = ['wav']
+
+        self.default_format = DEFAULT_AUDIO_FORMAT if DEFAULT_AUDIO_FORMAT in self.formats else 'wav'
+
+    def negotiate(self, requested=None, accept=None):
+        """
+        Pick the output format.
+
+        An explicit `requested` format wins, then the client's preferred
+        audio type from the Accept header (wildcards don't count), then the
+        default format.
+
+        Args:
+            requested: Format name from the URL, e.g. "mp3"
+            accept: werkzeug MIMEAccept for the request's Accept header
+        """
+        if requested in self.formats:
+            return requested
+
+        if accept:
+            ranked = sorted(
+                ((quality, mimetype) for mimetype, quality in accept if quality > 0),
+                key=lambda item: item[0],
+                reverse=True
+            )
+            for _, mimetype in ranked:
+                fmt = ACCEPT_TYPES.get(mimetype.split(';')[0].strip().lower())
+                if fmt in self.formats:
+                    return fmt
+
+        return self.default_format
+
+    def get(self, wav_filename, fmt):
+        """
+        Return the filename of `wav_filename` encoded as `fmt`.
+
+        Returns:
+            The cached filename, or None if the WAV is missing or encoding failed
+        """
+        if fmt == 'wav' or fmt not in self.formats:
+            return wav_filename if self.audio_cache.lookup(wav_filename) else None
+
+        target = f"{os.path.splitext(wav_filename)[0]}.{fmt}"
+        if self.audio_cache.lookup(target):
+            return target
+
+        result, _ = self._flight.do(target, self._encode, wav_filename, target, fmt)
+        return result
+
+    def _encode(self, wav_filename, target, fmt):
+        """Run ffmpeg to produce `target` from the WAV (single-flight leader only)."""
+        if not self.audio_cache.lookup(wav_filename):
+            return None
+
+        target_path = os.path.join(self.directory, target)
+        tmp_path = f"{target_path}.tmp"
+        cmd = [
+            self.ffmpeg, '-y', '-loglevel', 'error',
+            '-i', os.path.join(self.directory, wav_filename),
+            *FFMPEG_CODECS[fmt],
+            '-b:a', AUDIO_BITRATES[fmt],
+            tmp_path
+        ]
+
+        try:
+            subprocess.run(cmd, check=True, capture_output=True)
+            os.replace(tmp_path, target_path)
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.error(f"Transcoding {wav_filename} to {fmt} failed: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return None
+
+        self.audio_cache.add(target)
+        logger.info(f"Encoded {wav_filename} as {fmt} ({AUDIO_BITRATES[fmt]})")
+        return target
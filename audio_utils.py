@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Audio helpers for NewsBreeze - sentence splitting and 16-bit PCM WAV encoding.
+"""
+
+import os
+import re
+import struct
+import tempfile
+import numpy as np
+
+SENTENCE_END = re.compile(r'(?:(?<=[.!?])|(?<=[.!?]["\')\]]))\s+(?=["\'(\[]?[A-Z0-9])')
+
+# Titles and abbreviations whose period usually doesn't end a sentence
+ABBREVIATIONS = (
+    'mr', 'mrs', 'ms', 'dr', 'prof', 'st', 'jr', 'sr', 'gen', 'gov', 'sen', 'rep', 'col',
+    'lt', 'sgt', 'capt', 'mt', 'ft', 'vs', 'jan', 'feb', 'aug', 'sept', 'oct', 'nov', 'dec'
+)
+# A piece ending in one of them, or in an initial ("J.", "U.S."), continues in the next piece
+ABBREVIATION_END = re.compile(
+    r'(?:^|[\s("\'.])(?:%s|[A-Za-z])\.$' % '|'.join(ABBREVIATIONS),
+    re.IGNORECASE
+)
+
+# Size field used while streaming, when the final length is unknown
+STREAMING_SIZE = 0xFFFFFFFF
+
+def split_sentences(text):
+    """Split text into sentences at terminal punctuation followed by a capital."""
+    sentences = []
+    for piece in SENTENCE_END.split(text):
+        piece = piece.strip()
+        if not piece:
+            continue
+        if sentences and ABBREVIATION_END.search(sentences[-1]):
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    return sentences
+
+def crossfade_concat(waveforms, sample_rate, crossfade_ms):
+    """Join waveforms end to end with a short linear crossfade at each seam."""
+    waveforms = [np.asarray(w, dtype=np.float32) for w in waveforms if len(w)]
+    if not waveforms:
+        return np.zeros(0, dtype=np.float32)
+
+    overlap = int(sample_rate * crossfade_ms / 1000)
+    output = waveforms[0]
+    for waveform in waveforms[1:]:
+        n = min(overlap, len(output), len(waveform))
+        if n == 0:
+            output = np.concatenate([output, waveform])
+            continue
+        fade_in = np.linspace(0.0, 1.0, n, dtype=np.float32)
+        seam = output[-n:] * (1.0 - fade_in) + waveform[:n] * fade_in
+        output = np.concatenate([output[:-n], seam, waveform[n:]])
+    return output
+
+def to_pcm16(waveform):
+    """Convert a float waveform in [-1, 1] to little-endian 16-bit PCM bytes."""
+    samples = np.clip(np.asarray(waveform, dtype=np.float32), -1.0, 1.0)
+    return (samples * 32767).astype('<i2').tobytes()
+
+def wav_header(sample_rate, data_size=STREAMING_SIZE, channels=1, sample_width=2):
+    """Build a 44-byte PCM WAV header. Use the default size when streaming."""
+    riff_size = STREAMING_SIZE if data_size == STREAMING_SIZE else 36 + data_size
+    byte_rate = sample_rate * channels * sample_width
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', riff_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, byte_rate, channels * sample_width, sample_width * 8,
+        b'data', data_size
+    )
+
+def write_wav(path, pcm, sample_rate):
+    """Atomically write 16-bit mono PCM bytes to a WAV file."""
+    directory = os.path.dirname(path) or '.'
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(wav_header(sample_rate, len(pcm)))
+            f.write(pcm)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Summarizer benchmark for NewsBreeze - compares inference backends.
+
+Runs the same articles through each backend and reports load time,
+per-article latency, batched throughput and ROUGE-1/2/L F1 against the
+full-precision PyTorch summaries.
+
+Usage:
+    python benchmark_summarizer.py
+    python benchmark_summarizer.py --backends pytorch quantized --articles 40
+    python benchmark_summarizer.py --input articles.json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import time
+from collections import Counter
+from summarizer import NewsSummarizer, BACKENDS
+from config import SUMMARIZATION_BATCH_SIZE
+
+def load_texts(input_path=None, limit=20):
+    """
+    Load article texts from a JSON file or the live feeds.
+
+    Args:
+        input_path: JSON list of strings or of articles with a description
+        limit: Maximum number of texts
+    """
+    if input_path:
+        with open(input_path, 'r', encoding='utf-8') as f:
+            items = json.load(f)
+    else:
+        from news_fetcher import NewsFetcher
+        items = NewsFetcher().fetch_news(max_articles=limit * 2)
+
+    texts = []
+    for item in items:
+        text = item if isinstance(item, str) else item.get('content') or item.get('description', '')
+        # Shorter texts are returned as-is and would not exercise the model
+        if len(text.split()) >= 50:
+            texts.append(text)
+    return texts[:limit]
+
+def _ngrams(tokens, n):
+    return Counter(tuple(tokens[i:i + n]) for i in range(len(tokens) - n + 1))
+
+def _f1(overlap, candidate_total, reference_total):
+    if not overlap or not candidate_total or not reference_total:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+def _lcs_length(a, b):
+    previous = [0] * (len(b) + 1)
+    for token in a:
+        current = [0]
+        for j, other in enumerate(b):
+            current.append(previous[j] + 1 if token == other else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+def rouge(candidate, reference):
+    """ROUGE-1, ROUGE-2 and ROUGE-L F1 of a candidate against a reference summary."""
+    cand = candidate.lower().split()
+    ref = reference.lower().split()
+    scores = {}
+    for n in (1, 2):
+        cand_ngrams, ref_ngrams = _ngrams(cand, n), _ngrams(ref, n)
+        overlap = sum((cand_ngrams & ref_ngrams).values())
+        scores[f'rouge{n}'] = _f1(overlap, sum(cand_ngrams.values()), sum(ref_ngrams.values()))
+    scores['rougeL'] = _f1(_lcs_length(cand, ref), len(cand), len(ref))
+    return scores
+
+def benchmark_backend(backend, texts, batch_size):
+    """Load one backend and time single and batched summarization."""
+    summarizer = NewsSummarizer(backend=backend)
+
+    start = time.perf_counter()
+    if not summarizer.load_model():
+        return None
+    load_seconds = time.perf_counter() - start
+
+    # Warm-up call so one-off graph/kernel setup is not timed
+    summarizer.summarize(texts[0])
+
+    latencies = []
+    for text in texts:
+        start = time.perf_counter()
+        summarizer.summarize(text)
+        latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    summaries = summarizer.batch_summarize(texts, batch_size=batch_size)
+    batch_seconds = time.perf_counter() - start
+
+    return {
+        'backend': backend,
+        'load_seconds': load_seconds,
+        'latency_p50': statistics.median(latencies),
+        'latency_p95': sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)],
+        'throughput': len(texts) / batch_seconds,
+        'summaries': summaries
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NewsBreeze summarizer backends")
+    parser.add_argument('--backends', nargs='+', choices=BACKENDS, default=list(BACKENDS))
+    parser.add_argument('--articles', type=int, default=20, help="number of articles to summarize")
+    parser.add_argument('--input', help="JSON file of texts or articles instead of the live feeds")
+    parser.add_argument('--batch-size', type=int, default=SUMMARIZATION_BATCH_SIZE)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    texts = load_texts(args.input, args.articles)
+    if not texts:
+        print("No articles long enough to summarize")
+        return
+    print(f"Benchmarking {len(args.backends)} backend(s) on {len(texts)} articles\n")
+
+    # PyTorch output is the quality reference, so it always runs first
+    backends = ['pytorch'] + [b for b in args.backends if b != 'pytorch']
+    results = []
+    reference = None
+    for backend in backends:
+        print(f"Running {backend}...")
+        result = benchmark_backend(backend, texts, args.batch_size)
+        if result is None:
+            print(f"  ❌ {backend} backend failed to load, skipping")
+            continue
+        if backend == 'pytorch':
+            reference = result['summaries']
+            if backend not in args.backends:
+                continue
+        if reference:
+            scores = [rouge(c, r) for c, r in zip(result['summaries'], reference)]
+            for key in ('rouge1', 'rouge2', 'rougeL'):
+                result[key] = statistics.mean(s[key] for s in scores)
+        results.append(result)
+
+    print()
+    print(f"{'backend':<10} {'load s':>8} {'p50 s':>8} {'p95 s':>8} {'art/s':>8} {'R-1':>6} {'R-2':>6} {'R-L':>6}")
+    for r in results:
+        quality = ' '.join(f"{r[key]:>6.3f}" if key in r else f"{'-':>6}" for key in ('rouge1', 'rouge2', 'rougeL'))
+        print(
+            f"{r['backend']:<10} {r['load_seconds']:>8.2f} {r['latency_p50']:>8.3f} "
+            f"{r['latency_p95']:>8.3f} {r['throughput']:>8.2f} {quality}"
+        )
+
+if __name__ == '__main__':
+    main()
@@ -10,24 +10,64 @@ CACHE_DIR = os.path.join(BASE_DIR, 'cache')
 AUDIO_DIR = os.path.join(BASE_DIR, 'static', 'audio')
 MODELS_DIR = os.path.join(BASE_DIR, 'models')
 VOICES_DIR = os.path.join(BASE_DIR, 'voices')
+AUDIO_SEGMENTS_DIR = os.path.join(CACHE_DIR, 'segments')
+SPEAKER_LATENTS_DIR = os.path.join(MODELS_DIR, 'speaker_latents')
+ONNX_MODELS_DIR = os.path.join(MODELS_DIR, 'onnx')
 
 # AI Model settings
 SUMMARIZATION_MODEL = "Falconsai/text_summarization"
 VOICE_MODEL = "tts_models/multilingual/multi-dataset/xtts_v2"
 
+# Summarizer inference backend: "pytorch", "quantized" (dynamic int8, CPU only)
+# or "onnx" (ONNX Runtime, needs optimum[onnxruntime]); see benchmark_summarizer.py
+SUMMARIZER_BACKEND = "pytorch"
+
+# Model worker processes (0 = run the model inside the web process)
+SUMMARIZER_WORKERS = 0
+TTS_WORKERS = 0
+
 # Summarization settings
 MAX_SUMMARY_LENGTH = 150
 MIN_SUMMARY_LENGTH = 30
+SUMMARIZATION_BATCH_SIZE = 8  # sequences per generate() call in batch_summarize
+MAX_INPUT_TOKENS = 512  # model context window
+SUMMARY_CHUNK_OVERLAP = 32  # tokens shared by neighbouring chunks of a long article
+MAX_SUMMARY_CHUNKS = 8  # chunks summarized per article; text beyond them is dropped
 
 # Voice synthesis settings
 AUDIO_SAMPLE_RATE = 22050
 VOICE_SPEED = 1.0
+MAX_SYNTHESIS_CHARS = 1000  # text is truncated beyond this outside streaming mode
+CROSSFADE_MS = 15  # crossfade between cached sentence segments
+SYNTHESIS_WORKERS = 1  # concurrent TTS jobs for the async job API
+MAX_PENDING_SYNTHESIS_JOBS = 32  # queued + running jobs before new ones are rejected
+JOB_RETENTION_MINUTES = 30  # how long finished jobs stay queryable
 
 # News fetching settings
 NEWS_REFRESH_INTERVAL = 30  # minutes
 REQUEST_TIMEOUT = 10  # seconds
+FETCH_MAX_WORKERS = 8  # concurrent feed downloads
+FETCH_DEADLINE = 15  # seconds, overall budget for one refresh
+MAX_NEWS_ARTICLES = 50  # articles returned per /api/news request
+NEWS_RESPONSE_CACHE_ITEMS = 64  # serialized /api/news responses kept per refresh
+COMPRESS_MIN_BYTES = 1024  # smaller responses are sent uncompressed
+
+# Near-duplicate story detection across sources (MinHash with LSH banding)
+DEDUP_ENABLED = True
+DEDUP_THRESHOLD = 0.5  # Jaccard similarity of title+description shingles
+DEDUP_NUM_PERM = 64  # MinHash permutations
+DEDUP_BANDS = 16  # LSH bands (rows per band = DEDUP_NUM_PERM / DEDUP_BANDS)
+
+# Article search
+SEARCH_INDEX_MAX_DOCS = 10000  # oldest articles are dropped beyond this
+SEARCH_RESULTS_LIMIT = 20
+
+# Article archive (SQLite history of every fetched article)
+ARCHIVE_RETENTION_DAYS = 90
+ARCHIVE_PAGE_SIZE = 50
 
 # News sources configuration
+# A source may set "refresh_interval" (minutes) to override NEWS_REFRESH_INTERVAL.
 NEWS_SOURCES = {
     "bbc": {
         "url": "http://feeds.bbci.co.uk/news/rss.xml",
@@ -87,17 +127,34 @@ NEWS_SOURCES = {
     }
 }
 
+# Prefetch settings (summaries and audio for new articles, generated in the background)
+PREFETCH_ENABLED = True
+PREFETCH_QUEUE_SIZE = 200  # max pending items per stage
+PREFETCH_VOICES = 1  # synthesize audio in this many of the most requested voices
+DEFAULT_VOICE = "morgan_freeman"
+
 # UI settings
 THEME_OPTIONS = ["light", "dark"]
 DEFAULT_THEME = "light"
 
 # Audio settings
-AUDIO_FORMATS = ["wav", "mp3"]
-DEFAULT_AUDIO_FORMAT = "wav"
+AUDIO_FORMATS = ["wav", "mp3", "opus"]  # compressed formats need ffmpeg
+DEFAULT_AUDIO_FORMAT = "mp3"  # served when neither ?format= nor Accept picks one
+AUDIO_BITRATES = {
+    "mp3": "64k",
+    "opus": "32k"
+}
+AUDIO_CACHE_MAX_AGE = 365 * 24 * 3600  # audio filenames are content hashes, so responses never change
+AUDIO_USE_X_SENDFILE = False  # let Apache/lighttpd send files via X-Sendfile
+AUDIO_ACCEL_REDIRECT_PREFIX = None  # e.g. "/protected-audio/" to hand files to nginx via X-Accel-Redirect
 
 # Cache settings
 CACHE_EXPIRY_HOURS = 24
-MAX_CACHE_SIZE_MB = 500
+MAX_CACHE_SIZE_MB = 500  # audio cache budget
+AUDIO_CACHE_POLICY = "lru"  # "lru" or "lfu"
+SEGMENT_CACHE_MAX_MB = 200  # per-sentence audio segments
+SUMMARY_CACHE_MAX_MB = 50  # summary store budget
+SUMMARY_MEMORY_ITEMS = 2000  # summaries kept in the in-process LRU
 
 # API rate limiting
 MAX_REQUESTS_PER_MINUTE = 60
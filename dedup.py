@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Story deduplication for NewsBreeze - MinHash/LSH clustering of the same story across sources.
+"""
+
+import zlib
+import logging
+import numpy as np
+from extractive import tokenize
+from config import DEDUP_THRESHOLD, DEDUP_NUM_PERM, DEDUP_BANDS
+
+logger = logging.getLogger(__name__)
+
+# Mersenne prime for the universal hash family; keeps a * x below 2**62
+PRIME = (1 << 31) - 1
+
+def shingles(article):
+    """Content words and word pairs of an article's title and description."""
+    words = tokenize(f"{article.get('title', '')} {article.get('description', '')}")
+    return set(words) | {f"{a} {b}" for a, b in zip(words, words[1:])}
+
+def _jaccard(a, b):
+    return len(a & b) / len(a | b) if a or b else 0.0
+
+class StoryDeduplicator:
+    """
+    Groups articles that report the same story, e.g. one wire piece
+    republished by several outlets.
+
+    MinHash signatures are computed for all articles at once with NumPy
+    and bucketed with LSH banding, so only articles that share a band are
+    compared. Candidate pairs are confirmed with the exact Jaccard
+    similarity of their shingles. Shingles and signatures are cached per
+    article ID, so a refresh only hashes new articles.
+    """
+
+    def __init__(self, threshold=DEDUP_THRESHOLD, num_perm=DEDUP_NUM_PERM, bands=DEDUP_BANDS):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.threshold = threshold
+        self.bands = bands
+        rng = np.random.default_rng(1)
+        self._a = rng.integers(1, PRIME, size=(num_perm, 1), dtype=np.int64)
+        self._b = rng.integers(0, PRIME, size=(num_perm, 1), dtype=np.int64)
+        self._cache = {}
+
+    def _signatures(self, articles):
+        """Shingle sets and MinHash signature rows for articles, reusing cached ones."""
+        new = [a for a in articles if a['id'] not in self._cache]
+        sets = [shingles(a) for a in new]
+
+        hashed = [(article, s) for article, s in zip(new, sets) if s]
+        if hashed:
+            values = np.array(
+                [zlib.crc32(shingle.encode()) % PRIME for _, s in hashed for shingle in s],
+                dtype=np.int64
+            )
+            offsets = np.cumsum([0] + [len(s) for _, s in hashed[:-1]])
+            # (num_perm, total shingles) -> per-article minimum of every permutation
+            signatures = np.minimum.reduceat((self._a * values + self._b) % PRIME, offsets, axis=1).T
+            for (article, s), signature in zip(hashed, signatures):
+                self._cache[article['id']] = (s, signature)
+
+        for article, s in zip(new, sets):
+            if not s:
+                self._cache[article['id']] = (s, None)
+
+        # Forget articles that are no longer fetched
+        ids = {a['id'] for a in articles}
+        for article_id in [i for i in self._cache if i not in ids]:
+            del self._cache[article_id]
+
+        return [self._cache[a['id']] for a in articles]
+
+    def cluster(self, articles):
+        """
+        Group duplicate articles.
+
+        Args:
+            articles: List of article dictionaries (each with an 'id')
+
+        Returns:
+            List of clusters with more than one article, each a list of
+            indexes into `articles`
+        """
+        entries = self._signatures(articles)
+        parent = list(range(len(articles)))
+
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        indexed = [i for i, (_, signature) in enumerate(entries) if signature is not None]
+        if len(indexed) < 2:
+            return []
+
+        bands = np.stack([entries[i][1] for i in indexed]).reshape(len(indexed), self.bands, -1)
+        checked = set()
+        for band in range(self.bands):
+            buckets = {}
+            for position, i in enumerate(indexed):
+                buckets.setdefault(bands[position, band].tobytes(), []).append(i)
+
+            for members in buckets.values():
+                for j, first in enumerate(members):
+                    for second in members[j + 1:]:
+                        if (first, second) in checked or find(first) == find(second):
+                            continue
+                        checked.add((first, second))
+                        if _jaccard(entries[first][0], entries[second][0]) >= self.threshold:
+                            parent[find(second)] = find(first)
+
+        clusters = {}
+        for i in indexed:
+            clusters.setdefault(find(i), []).append(i)
+        return [members for members in clusters.values() if len(members) > 1]
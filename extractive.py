@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Extractive summarizer for NewsBreeze - fast TF-IDF sentence selection without a model.
+"""
+
+import re
+import numpy as np
+from audio_utils import split_sentences
+
+WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been
+before being below between both but by can could did do does doing down during each
+few for from further had has have having he her here hers herself him himself his how
+i if in into is it its itself just me more most my myself no nor not now of off on
+once only or other our ours ourselves out over own said same says she should so some
+such than that the their theirs them themselves then there these they this those
+through to too under until up very was we were what when where which while who whom
+why will with would you your yours yourself yourselves
+""".split())
+
+def tokenize(sentence):
+    """Lowercase content words of a sentence, without stopwords."""
+    return [word for word in WORD.findall(sentence.lower()) if word not in STOPWORDS]
+
+def summarize(text, num_sentences=3):
+    """Pick the `num_sentences` most central sentences of one text."""
+    return summarize_batch([text], num_sentences)[0]
+
+def summarize_batch(texts, num_sentences=3):
+    """
+    Extractive summaries for a batch of texts.
+
+    Every sentence in the batch is treated as a document for IDF, so
+    words common across today's news weigh less. Each sentence is scored
+    by cosine similarity between its TF-IDF vector and its article's
+    centroid, and the top sentences are returned in their original order.
+    All scoring runs on sparse (row, term, weight) arrays.
+
+    Args:
+        texts: List of article texts
+        num_sentences: Sentences per summary
+
+    Returns:
+        List of summaries, in the same order as `texts`
+    """
+    summaries = [' '.join(text.split()) if text else '' for text in texts]
+
+    # Texts that are already short enough are returned as-is
+    articles = []
+    for index, text in enumerate(texts):
+        sentences = split_sentences(text) if text else []
+        if len(sentences) > num_sentences:
+            articles.append((index, sentences))
+    if not articles:
+        return summaries
+
+    vocab = {}
+    rows, cols, article_of_row = [], [], []
+    row = 0
+    for article, (_, sentences) in enumerate(articles):
+        for sentence in sentences:
+            for word in tokenize(sentence):
+                rows.append(row)
+                cols.append(vocab.setdefault(word, len(vocab)))
+            article_of_row.append(article)
+            row += 1
+
+    num_rows = row
+    sentence_articles = np.array(article_of_row)
+    if not rows:
+        scores = np.zeros(num_rows)
+    else:
+        rows = np.array(rows)
+        cols = np.array(cols)
+
+        # Term counts per (sentence, term) pair
+        pair_keys, pair_index = np.unique(rows * len(vocab) + cols, return_inverse=True)
+        counts = np.bincount(pair_index).astype(np.float64)
+        pair_rows = pair_keys // len(vocab)
+        pair_cols = pair_keys % len(vocab)
+
+        # Smoothed IDF over all sentences in the batch
+        df = np.bincount(pair_cols, minlength=len(vocab))
+        idf = np.log((1 + num_rows) / (1 + df)) + 1
+        weights = (1 + np.log(counts)) * idf[pair_cols]
+
+        # Article centroids, summed over (article, term)
+        pair_articles = sentence_articles[pair_rows]
+        centroid_keys, centroid_index = np.unique(pair_articles * len(vocab) + pair_cols, return_inverse=True)
+        centroid = np.bincount(centroid_index, weights=weights)
+        centroid_norms = np.sqrt(np.bincount(centroid_keys // len(vocab), weights=centroid ** 2, minlength=len(articles)))
+
+        dot = np.bincount(pair_rows, weights=weights * centroid[centroid_index], minlength=num_rows)
+        sentence_norms = np.sqrt(np.bincount(pair_rows, weights=weights ** 2, minlength=num_rows))
+        denominator = sentence_norms * centroid_norms[sentence_articles]
+        scores = np.divide(dot, denominator, out=np.zeros(num_rows), where=denominator > 0)
+
+    start = 0
+    for index, sentences in articles:
+        # Ties (e.g. no content words) go to earlier sentences, the news lede
+        article_scores = scores[start:start + len(sentences)] - np.arange(len(sentences)) * 1e-9
+        # Top-k without a full sort
+        top = np.argpartition(-article_scores, num_sentences - 1)[:num_sentences]
+        summaries[index] = ' '.join(sentences[i] for i in sorted(top))
+        start += len(sentences)
+
+    return summaries
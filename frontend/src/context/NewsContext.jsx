@@ -169,21 +169,18 @@ export function NewsProvider({ children }) {
     dispatch({ type: 'SET_CURRENT_ARTICLE', payload: article })
 
     try {
-      const result = await apiService.generateAudio(articleId, state.selectedVoice)
+      const text = article.summary || article.description || article.title
+      const result = await apiService.synthesizeAudio(text, state.selectedVoice, articleId)
       
-      if (result.success) {
-        dispatch({ type: 'SET_CURRENT_AUDIO', payload: result.audio_url })
-        
-        if (state.preferences.autoPlay) {
-          dispatch({ type: 'SET_PLAYING', payload: true })
-        }
-        
-        toast.success('Audio generated successfully!')
-      } else {
-        toast.error(`Audio generation failed: ${result.error}`)
+      dispatch({ type: 'SET_CURRENT_AUDIO', payload: result.audio_url })
+      
+      if (state.preferences.autoPlay) {
+        dispatch({ type: 'SET_PLAYING', payload: true })
       }
+      
+      toast.success('Audio generated successfully!')
     } catch (error) {
-      toast.error('Audio generation failed. Please try again.')
+      toast.error(`Audio generation failed: ${error.message}`)
       console.error('Audio generation error:', error)
     } finally {
       dispatch({ type: 'SET_LOADING', payload: { type: 'audio', value: false } })
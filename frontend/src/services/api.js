@@ -4,7 +4,7 @@ const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:5000
 
 const api = axios.create({
   baseURL: API_BASE_URL,
-  timeout: 60000, // 1 minute for audio generation
+  timeout: 15000, // audio is synthesized as a polled job, so no request waits on TTS
   headers: {
     'Content-Type': 'application/json',
   },
@@ -36,7 +36,7 @@ api.interceptors.response.use(
     }
     
     if (error.code === 'ECONNABORTED') {
-      throw new Error('Request timeout. Audio generation might take longer than expected.')
+      throw new Error('Request timeout. Please try again.')
     }
     
     throw error
@@ -113,6 +113,33 @@ export const apiService = {
     }
   },
 
+  // Queue voice synthesis and poll the job until the audio is ready
+  async synthesizeAudio(text, voice, articleId, pollInterval = 1000) {
+    try {
+      let { data: job } = await api.post('/api/synthesize/jobs', {
+        text,
+        voice,
+        article_id: articleId
+      })
+
+      while (job.status === 'queued' || job.status === 'running') {
+        await new Promise((resolve) => setTimeout(resolve, pollInterval))
+        const response = await api.get(`/api/synthesize/jobs/${job.job_id}`)
+        job = response.data
+      }
+
+      if (job.status === 'failed') {
+        throw new Error(job.error || 'Voice synthesis failed')
+      }
+      return { ...job, audio_url: `${API_BASE_URL}/${job.audio_file}` }
+    } catch (error) {
+      if (error.response?.data?.error) {
+        throw new Error(error.response.data.error)
+      }
+      throw error
+    }
+  },
+
   // Get article by ID
   async getArticle(articleId) {
     try {
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Model Warm-up for NewsBreeze - background, load-once model initialization.
+"""
+
+import threading
+import time
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ModelWarmup:
+    """
+    Loads each model once on its own background thread and tracks its state.
+
+    States are pending -> loading -> ready/failed. Callers on the request
+    path check `is_ready()` and degrade instead of blocking; background
+    work can `wait()` for a model to finish loading.
+    """
+
+    def __init__(self, models):
+        """
+        Args:
+            models: Dictionary mapping a model name to an object with load_model()
+        """
+        self.models = models
+        self._state = {
+            name: {'status': 'pending', 'load_seconds': None, 'error': None}
+            for name in models
+        }
+        self._done = {name: threading.Event() for name in models}
+        self._lock = threading.Lock()
+        self._started = False
+
+    def start(self):
+        """Begin loading every model (no-op after the first call)."""
+        with self._lock:
+            if self._started:
+                return
+            self._started = True
+
+        for name in self.models:
+            thread = threading.Thread(target=self._load, args=(name,), name=f'warmup-{name}', daemon=True)
+            thread.start()
+
+    def _load(self, name):
+        self._set(name, status='loading')
+        logger.info(f"Warming up {name}...")
+        start = time.monotonic()
+        try:
+            ok = self.models[name].load_model()
+            error = None if ok else 'load_model() returned False'
+        except Exception as e:
+            ok, error = False, str(e)
+
+        elapsed = round(time.monotonic() - start, 2)
+        self._set(name, status='ready' if ok else 'failed', load_seconds=elapsed, error=error)
+        if ok:
+            logger.info(f"✅ {name} ready in {elapsed}s")
+        else:
+            logger.warning(f"⚠️  {name} failed to load after {elapsed}s: {error}")
+        self._done[name].set()
+
+    def _set(self, name, **fields):
+        with self._lock:
+            self._state[name].update(fields)
+
+    def status(self, name):
+        """Current status of one model."""
+        return self._state[name]['status']
+
+    def is_ready(self, name):
+        return self.status(name) == 'ready'
+
+    def is_warming(self, name):
+        """True while a model has not finished its first load attempt."""
+        return self.status(name) in ('pending', 'loading')
+
+    def wait(self, name, timeout=None):
+        """Block until a model has finished loading. Returns True if it is ready."""
+        self.start()
+        self._done[name].wait(timeout)
+        return self.is_ready(name)
+
+    def get_status(self):
+        """Status, load duration and error of every model."""
+        with self._lock:
+            return {name: dict(state) for name, state in self._state.items()}
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Model Workers for NewsBreeze - summarization and TTS inference in separate processes.
+
+Each worker process loads its model once in the pool initializer and then
+serves requests submitted by the web tier. The client classes mirror the
+NewsSummarizer/VoiceSynthesizer interface, so NewsBreeze can use either.
+"""
+
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+import extractive
+from audio_utils import split_sentences
+from config import SUMMARIZER_WORKERS, TTS_WORKERS, SUMMARIZER_BACKEND
+
+logger = logging.getLogger(__name__)
+
+# Model instance owned by the current worker process
+_worker_model = None
+
+def _init_summarizer_worker():
+    global _worker_model
+    from summarizer import NewsSummarizer
+    logging.basicConfig(level=logging.INFO)
+    _worker_model = NewsSummarizer()
+    _worker_model.load_model()
+
+def _init_synthesizer_worker():
+    global _worker_model
+    from voice_synthesizer import VoiceSynthesizer
+    logging.basicConfig(level=logging.INFO)
+    _worker_model = VoiceSynthesizer()
+    _worker_model.load_model()
+
+def _is_ready():
+    return _worker_model.is_ready()
+
+def _summarize(text, max_length, min_length):
+    return _worker_model.summarize(text, max_length, min_length)
+
+def _batch_summarize(texts, max_length, min_length):
+    return _worker_model.batch_summarize(texts, max_length, min_length)
+
+def _register_voice(voice_name, voice_config):
+    """Make voices cloned in the web tier known to this worker."""
+    if voice_config and voice_name not in _worker_model.available_voices:
+        _worker_model.available_voices[voice_name] = voice_config
+
+def _synthesize(text, voice_name, voice_config, output_path):
+    _register_voice(voice_name, voice_config)
+    return _worker_model.synthesize(text, voice_name, output_path)
+
+def _synthesize_sentence(sentence, voice_name, voice_config):
+    _register_voice(voice_name, voice_config)
+    return list(_worker_model.synthesize_stream(sentence, voice_name))
+
+def _output_sample_rate():
+    return _worker_model.output_sample_rate
+
+def _create_pool(num_workers, initializer):
+    # spawn keeps CUDA and the parent's threads out of the workers
+    return ProcessPoolExecutor(
+        max_workers=num_workers,
+        mp_context=multiprocessing.get_context('spawn'),
+        initializer=initializer
+    )
+
+class SummarizerClient:
+    """NewsSummarizer stand-in that runs inference on a pool of worker processes."""
+
+    def __init__(self, num_workers=SUMMARIZER_WORKERS):
+        self.num_workers = num_workers
+        self.executor = _create_pool(num_workers, _init_summarizer_worker)
+        self._ready = False
+        self._load_lock = threading.Lock()
+
+    def load_model(self):
+        """Start every worker and wait for its model to load."""
+        with self._load_lock:
+            if self._ready:
+                return True
+            try:
+                futures = [self.executor.submit(_is_ready) for _ in range(self.num_workers)]
+                self._ready = all(future.result() for future in futures)
+            except Exception as e:
+                logger.error(f"❌ Summarizer workers failed to start: {e}")
+                self._ready = False
+            return self._ready
+
+    def is_ready(self):
+        return self._ready
+
+    def summarize(self, text, max_length=None, min_length=None):
+        return self.executor.submit(_summarize, text, max_length, min_length).result()
+
+    def extractive_summary(self, text, num_sentences=3):
+        return extractive.summarize(text, num_sentences)
+
+    def batch_summarize(self, texts, max_length=None, min_length=None):
+        """Split the batch across workers; each one batches its share."""
+        share = max(1, -(-len(texts) // self.num_workers))
+        futures = [
+            self.executor.submit(_batch_summarize, texts[i:i + share], max_length, min_length)
+            for i in range(0, len(texts), share)
+        ]
+        summaries = []
+        for future in futures:
+            summaries.extend(future.result())
+        return summaries
+
+    def get_model_info(self):
+        return {
+            'mode': 'process',
+            'backend': SUMMARIZER_BACKEND,
+            'workers': self.num_workers,
+            'is_ready': self._ready
+        }
+
+class VoiceSynthesizerClient:
+    """VoiceSynthesizer stand-in that runs TTS on a pool of worker processes."""
+
+    def __init__(self, num_workers=TTS_WORKERS):
+        from voice_synthesizer import VoiceSynthesizer
+
+        self.num_workers = num_workers
+        self.executor = _create_pool(num_workers, _init_synthesizer_worker)
+        self._ready = False
+        self._load_lock = threading.Lock()
+        self._sample_rate = None
+
+        # Model-less local instance for voice metadata, text preparation and cache stats
+        self.local = VoiceSynthesizer()
+
+    @property
+    def segment_cache(self):
+        return self.local.segment_cache
+
+    def load_model(self):
+        """Start every worker and wait for its model to load."""
+        with self._load_lock:
+            if self._ready:
+                return True
+            try:
+                futures = [self.executor.submit(_is_ready) for _ in range(self.num_workers)]
+                self._ready = all(future.result() for future in futures)
+            except Exception as e:
+                logger.error(f"❌ TTS workers failed to start: {e}")
+                self._ready = False
+            return self._ready
+
+    def is_ready(self):
+        return self._ready
+
+    def synthesize(self, text, voice_name="morgan_freeman", output_path=None):
+        voice_config = self.local.available_voices.get(voice_name)
+        return self.executor.submit(_synthesize, text, voice_name, voice_config, output_path).result()
+
+    def synthesize_stream(self, text, voice_name="morgan_freeman"):
+        """Fan sentences out to the workers and yield their audio in order."""
+        voice_name, voice_config = self.local._resolve_voice(voice_name)
+        sentences = split_sentences(self.local._prepare_text(text, max_chars=None))
+        futures = [
+            self.executor.submit(_synthesize_sentence, sentence, voice_name, voice_config)
+            for sentence in sentences
+        ]
+        try:
+            for future in futures:
+                yield from future.result()
+        finally:
+            # Client went away: drop sentences nobody will hear
+            for future in futures:
+                future.cancel()
+
+    @property
+    def output_sample_rate(self):
+        if self._sample_rate is None:
+            self._sample_rate = self.executor.submit(_output_sample_rate).result()
+        return self._sample_rate
+
+    def get_available_voices(self):
+        return self.local.get_available_voices()
+
+    def clone_voice(self, reference_audio_path, voice_name, description="Custom voice"):
+        # Workers pick the voice up from the config passed with each request
+        return self.local.clone_voice(reference_audio_path, voice_name, description)
+
+    def get_model_info(self):
+        info = self.local.get_model_info()
+        info.update({'mode': 'process', 'workers': self.num_workers, 'is_ready': self._ready})
+        return info
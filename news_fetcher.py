@@ -5,9 +5,12 @@ News Fetcher for NewsBreeze - RSS feed processing and news aggregation.
 
 import feedparser
 import requests
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 import logging
-from config import NEWS_SOURCES, REQUEST_TIMEOUT
+from config import NEWS_SOURCES, REQUEST_TIMEOUT, FETCH_MAX_WORKERS, FETCH_DEADLINE
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +23,15 @@ class NewsFetcher:
         self.session.headers.update({
             'User-Agent': 'NewsBreeze/1.0 (News Aggregator)'
         })
+        self.executor = ThreadPoolExecutor(
+            max_workers=FETCH_MAX_WORKERS,
+            thread_name_prefix='feed-fetch'
+        )
+        # Per-source HTTP validators and the articles parsed from that response
+        self._feed_cache = {}
+        self._feed_cache_lock = threading.Lock()
     
-    def fetch_news(self, sources=None, category=None, max_articles=50):
+    def fetch_news(self, sources=None, category=None, max_articles=50, concurrent=True):
         """
         Fetch news from RSS feeds.
         
@@ -29,6 +39,7 @@ class NewsFetcher:
             sources: List of source names to fetch from
             category: Category filter
             max_articles: Maximum number of articles to return
+            concurrent: Fetch all sources in parallel under FETCH_DEADLINE
             
         Returns:
             List of article dictionaries
@@ -41,36 +52,123 @@ class NewsFetcher:
         else:
             selected_sources = self.sources
         
+        # Skip sources whose category doesn't match
+        if category:
+            selected_sources = {
+                k: v for k, v in selected_sources.items()
+                if v.get('category') == category
+            }
+        
+        if concurrent:
+            results = self._fetch_concurrently(selected_sources)
+        else:
+            results = self._fetch_sequentially(selected_sources)
+        
+        for source_articles in results.values():
+            articles.extend(source_articles)
+        
+        # Sort by publication date (newest first)
+        articles.sort(key=lambda x: x.get('published_date', datetime.min), reverse=True)
+        
+        # Limit number of articles
+        return articles[:max_articles]
+    
+    def fetch_by_source(self, source_names=None):
+        """
+        Fetch the given sources concurrently, keeping results per source.
+        
+        Args:
+            source_names: List of source names to fetch (all sources if None)
+            
+        Returns:
+            Dictionary mapping source name to its list of articles. Sources
+            that failed or missed the deadline are absent.
+        """
+        if source_names is None:
+            selected_sources = self.sources
+        else:
+            selected_sources = {k: v for k, v in self.sources.items() if k in source_names}
+        
+        return self._fetch_concurrently(selected_sources)
+    
+    def _fetch_sequentially(self, selected_sources):
+        """Fetch sources one after another. Returns {source_name: articles}."""
+        results = {}
+        
         for source_name, source_config in selected_sources.items():
             try:
-                # Skip if category filter doesn't match
-                if category and source_config.get('category') != category:
-                    continue
-                
                 logger.info(f"Fetching from {source_name}...")
-                source_articles = self._fetch_from_source(source_name, source_config)
-                articles.extend(source_articles)
-                
+                results[source_name] = self._fetch_from_source(source_name, source_config)
             except Exception as e:
                 logger.error(f"Error fetching from {source_name}: {e}")
                 continue
         
-        # Sort by publication date (newest first)
-        articles.sort(key=lambda x: x.get('published_date', datetime.min), reverse=True)
+        return results
+    
+    def _fetch_concurrently(self, selected_sources, deadline=FETCH_DEADLINE):
+        """
+        Fetch sources in parallel on the fetch thread pool.
         
-        # Limit number of articles
-        return articles[:max_articles]
+        Each request is bounded by REQUEST_TIMEOUT; the whole batch is bounded
+        by `deadline`. Sources that have not answered by then are left out of
+        this refresh and their requests finish in the background.
+        
+        Returns:
+            Dictionary mapping source name to its list of articles
+        """
+        results = {}
+        if not selected_sources:
+            return results
+        
+        start = time.monotonic()
+        futures = {
+            self.executor.submit(self._fetch_from_source, source_name, source_config): source_name
+            for source_name, source_config in selected_sources.items()
+        }
+        done, not_done = wait(futures, timeout=deadline)
+        
+        for future in done:
+            source_name = futures[future]
+            try:
+                results[source_name] = future.result()
+            except Exception as e:
+                logger.error(f"Error fetching from {source_name}: {e}")
+        
+        if not_done:
+            late = sorted(futures[future] for future in not_done)
+            logger.warning(f"Deadline of {deadline}s exceeded, skipping: {', '.join(late)}")
+        
+        logger.info(f"Fetched {len(results)}/{len(futures)} sources in {time.monotonic() - start:.2f}s")
+        return results
     
     def _fetch_from_source(self, source_name, source_config):
         """Fetch articles from a single RSS source."""
         articles = []
         
         try:
+            with self._feed_cache_lock:
+                cached = self._feed_cache.get(source_name)
+            
+            # Send validators from the last successful fetch
+            headers = {}
+            if cached:
+                if cached.get('etag'):
+                    headers['If-None-Match'] = cached['etag']
+                if cached.get('last_modified'):
+                    headers['If-Modified-Since'] = cached['last_modified']
+            
             # Fetch RSS feed
             response = self.session.get(
                 source_config['url'], 
+                headers=headers,
                 timeout=REQUEST_TIMEOUT
             )
+            
+            # Feed unchanged, reuse the previously parsed articles
+            if response.status_code == 304 and cached:
+                logger.info(f"{source_name} not modified, reusing {len(cached['articles'])} articles")
+                return [dict(article) for article in cached['articles']]
+            
             response.raise_for_status()
             
             # Parse RSS feed
@@ -91,6 +189,16 @@ class NewsFetcher:
             
             logger.info(f"Fetched {len(articles)} articles from {source_name}")
             
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+            if etag or last_modified:
+                with self._feed_cache_lock:
+                    self._feed_cache[source_name] = {
+                        'etag': etag,
+                        'last_modified': last_modified,
+                        'articles': [dict(article) for article in articles]
+                    }
+            
         except requests.RequestException as e:
             logger.error(f"Network error fetching {source_name}: {e}")
         except Exception as e:
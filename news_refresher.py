@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+News Refresher for NewsBreeze - background feed polling with atomic snapshots.
+"""
+
+import threading
+import logging
+from datetime import datetime, timedelta
+from article_store import ArticleStore
+from config import NEWS_REFRESH_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+class NewsRefresher:
+    """
+    Polls news sources on their own intervals into a shared ArticleStore.
+
+    With an archive, fetched articles are also persisted, and the store can
+    be warm-started from it after a restart.
+    """
+
+    def __init__(self, news_fetcher, store=None, archive=None, max_articles=50, on_refresh=None):
+        self.news_fetcher = news_fetcher
+        self.store = store if store is not None else ArticleStore()
+        self.archive = archive
+        self.max_articles = max_articles
+        self.on_refresh = on_refresh
+
+        # When each source is due again
+        self._next_due = {}
+
+        # (latest articles across all sources, last_fetch) - replaced as a whole
+        self._snapshot = ([], None)
+
+        self._refresh_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """Start the background refresh thread (no-op if already running)."""
+        with self._start_lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run,
+                name='news-refresher',
+                daemon=True
+            )
+            self._thread.start()
+            logger.info("Background news refresher started")
+
+    def stop(self):
+        """Stop the background refresh thread."""
+        self._stopped.set()
+        self._wakeup.set()
+
+    def warm_start(self):
+        """
+        Serve the newest archived articles until the first refresh completes.
+
+        Sources are not marked as fetched, so the background thread still
+        refreshes all of them right away.
+
+        Returns:
+            True if the snapshot was loaded from the archive
+        """
+        if self.archive is None or self.last_fetch:
+            return False
+
+        results = self.archive.latest_by_source(self.max_articles)
+        if not results:
+            return False
+
+        self.store.update(results)
+        self._snapshot = (self.store.query(limit=self.max_articles), self.archive.last_fetched())
+        logger.info(f"Warm-started {len(self.store)} articles from the archive")
+        return True
+
+    def snapshot(self):
+        """Return the current (articles, last_fetch) snapshot."""
+        return self._snapshot
+
+    @property
+    def last_fetch(self):
+        return self._snapshot[1]
+
+    def refresh(self, force=False):
+        """
+        Refresh sources that are due (or all of them when forced).
+
+        Only one refresh runs at a time. A caller that arrives while a refresh
+        is in flight waits for it and shares its result instead of fetching
+        again.
+
+        Returns:
+            The snapshot after the refresh
+        """
+        if not self._refresh_lock.acquire(blocking=False):
+            # Another refresh is running; wait for it and reuse its snapshot
+            with self._refresh_lock:
+                return self._snapshot
+
+        try:
+            now = datetime.now()
+            if force:
+                due = list(self.news_fetcher.sources)
+            else:
+                due = [
+                    name for name in self.news_fetcher.sources
+                    if self._next_due.get(name, now) <= now
+                ]
+
+            if not due:
+                return self._snapshot
+
+            logger.info(f"Refreshing sources: {', '.join(due)}")
+            results = self.news_fetcher.fetch_by_source(due)
+
+            # Keep the previous articles if a source failed or came back empty
+            self.store.update({name: articles for name, articles in results.items() if articles})
+
+            if self.archive is not None:
+                try:
+                    self.archive.ingest(a for articles in results.values() for a in articles)
+                except Exception as e:
+                    logger.error(f"Archiving articles failed: {e}")
+
+            now = datetime.now()
+            for source_name in due:
+                self._next_due[source_name] = now + self._interval(source_name)
+
+            self._publish(now)
+            return self._snapshot
+
+        finally:
+            self._refresh_lock.release()
+
+    def _publish(self, timestamp):
+        """Swap in a new snapshot of the latest articles across all sources."""
+        self._snapshot = (self.store.query(limit=self.max_articles), timestamp)
+
+        if self.on_refresh:
+            try:
+                self.on_refresh(*self._snapshot)
+            except Exception as e:
+                logger.error(f"Refresh callback failed: {e}")
+
+    def _interval(self, source_name):
+        """Refresh interval for a source."""
+        source_config = self.news_fetcher.sources.get(source_name, {})
+        return timedelta(minutes=source_config.get('refresh_interval', NEWS_REFRESH_INTERVAL))
+
+    def _seconds_until_next_due(self):
+        """Seconds until the earliest source is due again."""
+        if len(self._next_due) < len(self.news_fetcher.sources):
+            return 0
+        next_due = min(self._next_due.values())
+        return max(0.0, (next_due - datetime.now()).total_seconds())
+
+    def _run(self):
+        """Background loop: refresh due sources, then sleep until the next one."""
+        while not self._stopped.is_set():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.error(f"Background refresh failed: {e}")
+
+            # Always wait a little so a failing loop can't spin
+            self._wakeup.wait(timeout=max(1.0, self._seconds_until_next_due()))
+            self._wakeup.clear()
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Prefetch Pipeline for NewsBreeze - warms summary and audio caches in the background.
+"""
+
+import heapq
+import itertools
+import threading
+import logging
+from collections import OrderedDict
+from config import PREFETCH_QUEUE_SIZE, PREFETCH_VOICES, SUMMARIZATION_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+class BoundedPriorityQueue:
+    """
+    Thread-safe priority queue with a fixed capacity.
+
+    Lower priority values are served first. When the queue is full, the
+    entry with the highest priority value (the least urgent) is dropped to
+    make room, or the new entry is dropped if it is the least urgent itself.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._heap = []
+        self._counter = itertools.count()
+        self._not_empty = threading.Condition()
+
+    def put(self, priority, item):
+        """Add an item. Returns False if it was dropped because the queue is full."""
+        with self._not_empty:
+            entry = (priority, next(self._counter), item)
+            if len(self._heap) >= self.maxsize:
+                worst = max(range(len(self._heap)), key=lambda i: self._heap[i][:2])
+                if entry[:2] >= self._heap[worst][:2]:
+                    return False
+                self._heap[worst] = self._heap[-1]
+                self._heap.pop()
+                heapq.heapify(self._heap)
+            heapq.heappush(self._heap, entry)
+            self._not_empty.notify()
+            return True
+
+    def get(self, timeout=None):
+        """Remove and return the most urgent item, or None after `timeout`."""
+        with self._not_empty:
+            if not self._heap and not self._not_empty.wait_for(lambda: self._heap, timeout):
+                return None
+            return heapq.heappop(self._heap)[2]
+
+    def get_nowait(self):
+        """Remove and return the most urgent item, or None if empty."""
+        with self._not_empty:
+            if not self._heap:
+                return None
+            return heapq.heappop(self._heap)[2]
+
+    def __len__(self):
+        return len(self._heap)
+
+class PrefetchPipeline:
+    """
+    Summarizes and synthesizes newly fetched articles before anyone asks.
+
+    Two stages run on their own threads: new articles are summarized in
+    batches, then each summary is queued for TTS in the most requested
+    voices. Both queues are bounded and serve the newest articles first.
+    """
+
+    def __init__(self, newsbreeze, queue_size=PREFETCH_QUEUE_SIZE, num_voices=PREFETCH_VOICES):
+        self.newsbreeze = newsbreeze
+        self.num_voices = num_voices
+        self.summary_queue = BoundedPriorityQueue(queue_size)
+        self.audio_queue = BoundedPriorityQueue(queue_size)
+
+        # Recently submitted article IDs, oldest first
+        self._seen = OrderedDict()
+        self._seen_limit = queue_size * 10
+        self._seen_lock = threading.Lock()
+
+        self._start_lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._threads = []
+
+    def start(self):
+        """Start the summary and audio worker threads (no-op if running)."""
+        with self._start_lock:
+            if self._threads:
+                return
+            self._stopped.clear()
+            for name, target in (('prefetch-summary', self._summary_worker),
+                                 ('prefetch-audio', self._audio_worker)):
+                thread = threading.Thread(target=target, name=name, daemon=True)
+                thread.start()
+                self._threads.append(thread)
+            logger.info("Prefetch pipeline started")
+
+    def stop(self):
+        """Ask the worker threads to exit."""
+        self._stopped.set()
+
+    def submit(self, articles):
+        """Queue articles that have not been seen before for summarization."""
+        queued = 0
+        with self._seen_lock:
+            for article in articles:
+                if article['id'] in self._seen:
+                    continue
+                self._seen[article['id']] = True
+                if len(self._seen) > self._seen_limit:
+                    self._seen.popitem(last=False)
+                if self.summary_queue.put(self._priority(article), article):
+                    queued += 1
+
+        if queued:
+            logger.info(f"Queued {queued} new articles for prefetch")
+        return queued
+
+    def get_stats(self):
+        """Queue depths for health reporting."""
+        return {
+            'summary_queue': len(self.summary_queue),
+            'audio_queue': len(self.audio_queue)
+        }
+
+    def _priority(self, article):
+        """Newest articles first."""
+        published_date = article.get('published_date')
+        return -published_date.timestamp() if published_date else 0
+
+    def _summary_worker(self):
+        """Summarize queued articles in batches and hand them to the audio stage."""
+        while not self._stopped.is_set():
+            article = self.summary_queue.get(timeout=1.0)
+            if article is None:
+                continue
+
+            batch = [article]
+            while len(batch) < SUMMARIZATION_BATCH_SIZE:
+                article = self.summary_queue.get_nowait()
+                if article is None:
+                    break
+                batch.append(article)
+
+            try:
+                summaries = self.newsbreeze.summarize_articles(batch)
+            except Exception as e:
+                logger.error(f"Prefetch summarization failed: {e}")
+                continue
+
+            voices = self.newsbreeze.get_popular_voices(self.num_voices)
+            for article in batch:
+                summary = summaries.get(article['id'])
+                if not summary:
+                    continue
+                for voice_name in voices:
+                    self.audio_queue.put(self._priority(article), (article['id'], summary, voice_name))
+
+    def _audio_worker(self):
+        """Synthesize queued summaries into the audio cache."""
+        while not self._stopped.is_set():
+            job = self.audio_queue.get(timeout=1.0)
+            if job is None:
+                continue
+
+            article_id, summary, voice_name = job
+            try:
+                self.newsbreeze.synthesize_voice(summary, voice_name, article_id, track_usage=False, wait=True)
+            except Exception as e:
+                logger.error(f"Prefetch synthesis failed for {article_id}: {e}")
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Response Cache for NewsBreeze - serialized, pre-compressed API responses per data version.
+"""
+
+import gzip
+import hashlib
+import threading
+from collections import OrderedDict
+from config import NEWS_RESPONSE_CACHE_ITEMS
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+class CachedResponse:
+    """A serialized response body with its ETag and compressed variants."""
+
+    def __init__(self, body, etag=None):
+        self.body = body
+        self.etag = etag or hashlib.md5(body).hexdigest()
+        self._encoded = {}
+        self._lock = threading.Lock()
+
+    @property
+    def encodings(self):
+        """Content codings this body can be served with, preferred first."""
+        return ['br', 'gzip'] if brotli is not None else ['gzip']
+
+    def encoded(self, encoding=None):
+        """The body in `encoding` ('br', 'gzip' or None), compressed on first use."""
+        if encoding is None:
+            return self.body
+        with self._lock:
+            data = self._encoded.get(encoding)
+            if data is None:
+                if encoding == 'br':
+                    data = brotli.compress(self.body, quality=5)
+                else:
+                    data = gzip.compress(self.body, compresslevel=6)
+                self._encoded[encoding] = data
+            return data
+
+class ResponseCache:
+    """
+    Keeps serialized responses for the current version of the data.
+
+    Callers pass the version their response was built from (e.g. the
+    ArticleStore version). A newer version drops every entry, so a body is
+    reused until the next refresh and never outlives it.
+    """
+
+    def __init__(self, max_entries=NEWS_RESPONSE_CACHE_ITEMS):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._version = None
+        self._lock = threading.Lock()
+
+    def get(self, key, version):
+        """Return the CachedResponse for `key` built from `version`, or None."""
+        with self._lock:
+            if version != self._version:
+                return None
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key, version, body, etag=None):
+        """
+        Cache a serialized body.
+
+        Args:
+            etag: ETag for the body; defaults to a hash of the body itself
+
+        Returns:
+            The CachedResponse (also returned, uncached, for stale versions)
+        """
+        entry = CachedResponse(body, etag)
+        with self._lock:
+            if self._version is None or version > self._version:
+                self._version = version
+                self._entries.clear()
+            if version == self._version:
+                self._entries[key] = entry
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Search Index for NewsBreeze - incrementally maintained inverted index with BM25 ranking.
+"""
+
+import bisect
+import heapq
+import math
+import threading
+import logging
+from datetime import datetime
+from extractive import tokenize
+from config import SEARCH_INDEX_MAX_DOCS
+
+logger = logging.getLogger(__name__)
+
+# Term frequency weight of each indexed field
+FIELD_WEIGHTS = {
+    'title': 3.0,
+    'tags': 2.0,
+    'summary': 1.5,
+    'description': 1.0,
+    'author': 1.0
+}
+
+# BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# Completions of the last query word that are searched
+MAX_PREFIX_EXPANSIONS = 20
+
+def _field_text(value):
+    if isinstance(value, (list, tuple)):
+        return ' '.join(str(v) for v in value)
+    return str(value or '')
+
+class SearchIndex:
+    """
+    Inverted index over fetched articles.
+
+    Postings map each term to {article ID: field-weighted term frequency},
+    so a query only touches the documents containing its terms. The last
+    query word also matches as a prefix, for search-as-you-type; prefixes
+    are resolved with bisect over a sorted term list that is rebuilt
+    lazily after updates. When the index grows past its limit, the oldest
+    articles are dropped.
+
+    Duplicate copies of a story are indexed too, but like in ArticleStore
+    they are only returned when their canonical article is filtered out.
+    """
+
+    def __init__(self, max_docs=SEARCH_INDEX_MAX_DOCS):
+        self.max_docs = max_docs
+        self._postings = {}
+        self._doc_terms = {}
+        self._doc_lengths = {}
+        self._docs = {}
+        self._summaries = {}
+        self._duplicates = {}
+        self._total_length = 0.0
+        self._sorted_terms = None
+        self._lock = threading.Lock()
+
+    def update(self, articles, duplicates=None):
+        """
+        Index new articles.
+
+        Already indexed articles are not re-tokenized; their stored copy is
+        replaced so results reflect the latest metadata.
+
+        Args:
+            articles: Iterable of article dictionaries
+            duplicates: Dictionary mapping duplicate article IDs to their
+                canonical article, replacing the previous mapping
+        """
+        with self._lock:
+            if duplicates is not None:
+                self._duplicates = dict(duplicates)
+
+            added = 0
+            for article in articles:
+                if article['id'] in self._docs:
+                    self._docs[article['id']] = article
+                else:
+                    self._add(article)
+                    added += 1
+
+            if len(self._docs) > self.max_docs:
+                self._evict()
+
+        if added:
+            logger.info(f"Indexed {added} articles ({len(self._docs)} total)")
+
+    def add_summary(self, article_id, summary):
+        """Make an article's generated summary searchable."""
+        with self._lock:
+            article = self._docs.get(article_id)
+            if article is None or self._summaries.get(article_id) == summary:
+                return
+            self._summaries[article_id] = summary
+            self._remove(article_id)
+            self._add(article)
+
+    def _add(self, article):
+        article_id = article['id']
+        fields = dict(article, summary=self._summaries.get(article_id))
+
+        frequencies = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            for term in tokenize(_field_text(fields.get(field))):
+                frequencies[term] = frequencies.get(term, 0.0) + weight
+
+        for term, frequency in frequencies.items():
+            postings = self._postings.get(term)
+            if postings is None:
+                postings = self._postings[term] = {}
+                self._sorted_terms = None
+            postings[article_id] = frequency
+
+        length = sum(frequencies.values())
+        self._docs[article_id] = article
+        self._doc_terms[article_id] = tuple(frequencies)
+        self._doc_lengths[article_id] = length
+        self._total_length += length
+
+    def _remove(self, article_id):
+        if article_id not in self._docs:
+            return
+        for term in self._doc_terms.pop(article_id):
+            postings = self._postings[term]
+            del postings[article_id]
+            if not postings:
+                del self._postings[term]
+                self._sorted_terms = None
+        self._total_length -= self._doc_lengths.pop(article_id)
+        del self._docs[article_id]
+
+    def _evict(self):
+        """Drop the oldest articles, down to 90% of the limit."""
+        excess = len(self._docs) - int(self.max_docs * 0.9)
+        oldest = heapq.nsmallest(
+            excess,
+            self._docs.values(),
+            key=lambda a: a.get('published_date') or datetime.min
+        )
+        for article in oldest:
+            self._remove(article['id'])
+            self._summaries.pop(article['id'], None)
+
+    def _expand_prefix(self, prefix):
+        """Indexed terms starting with `prefix`, most common first."""
+        if self._sorted_terms is None:
+            self._sorted_terms = sorted(self._postings)
+        terms = self._sorted_terms
+        start = bisect.bisect_left(terms, prefix)
+        end = bisect.bisect_left(terms, prefix + '\uffff', lo=start)
+        return heapq.nlargest(MAX_PREFIX_EXPANSIONS, terms[start:end], key=lambda t: len(self._postings[t]))
+
+    def search(self, query, sources=None, category=None, since=None, until=None, limit=20):
+        """
+        Rank articles against a query with BM25.
+
+        Args:
+            query: Free-text query; its last word also matches as a prefix
+            sources: Only include articles from these sources
+            category: Only include articles of this category
+            since: Only include articles published at or after this datetime
+            until: Only include articles published before this datetime
+            limit: Maximum number of results
+
+        Returns:
+            List of (score, article) tuples, best first
+        """
+        words = tokenize(query)
+        if not words:
+            return []
+
+        with self._lock:
+            num_docs = len(self._docs)
+            if not num_docs:
+                return []
+            average_length = self._total_length / num_docs
+
+            # Exact terms, plus completions of the word being typed
+            query_terms = set(words)
+            query_terms.update(self._expand_prefix(words[-1]))
+
+            scores = {}
+            rejected = set()
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                idf = math.log(1 + (num_docs - len(postings) + 0.5) / (len(postings) + 0.5))
+
+                for article_id, frequency in postings.items():
+                    if article_id in rejected:
+                        continue
+                    if article_id not in scores:
+                        if not self._is_shown(article_id, sources, category, since, until):
+                            rejected.add(article_id)
+                            continue
+                        scores[article_id] = 0.0
+
+                    norm = K1 * (1 - B + B * self._doc_lengths[article_id] / average_length)
+                    scores[article_id] += idf * frequency * (K1 + 1) / (frequency + norm)
+
+            best = heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+            return [(round(score, 4), self._docs[article_id]) for article_id, score in best]
+
+    def _is_shown(self, article_id, sources, category, since, until):
+        if not self._matches(self._docs[article_id], sources, category, since, until):
+            return False
+        canonical = self._duplicates.get(article_id)
+        return canonical is None or not self._matches(canonical, sources, category, since, until)
+
+    @staticmethod
+    def _matches(article, sources, category, since, until):
+        if sources and article.get('source') not in sources:
+            return False
+        if category and article.get('category') != category:
+            return False
+        published = article.get('published_date')
+        if since and (published is None or published < since):
+            return False
+        if until and (published is None or published >= until):
+            return False
+        return True
+
+    def suggest(self, prefix, limit=10):
+        """Autocomplete: indexed terms starting with `prefix`, most common first."""
+        words = tokenize(prefix)
+        if not words:
+            return []
+        with self._lock:
+            return self._expand_prefix(words[-1])[:limit]
+
+    def get_stats(self):
+        """Index size statistics."""
+        with self._lock:
+            return {
+                'documents': len(self._docs),
+                'terms': len(self._postings),
+                'summaries': len(self._summaries)
+            }
+
+    def __len__(self):
+        return len(self._docs)
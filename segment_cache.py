@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Segment Cache for NewsBreeze - per-sentence synthesized audio keyed by voice and text.
+"""
+
+import hashlib
+import os
+import re
+import logging
+import numpy as np
+from audio_cache import AudioCache
+from config import AUDIO_SEGMENTS_DIR, SEGMENT_CACHE_MAX_MB
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = re.compile(r'\s+')
+
+def normalize_sentence(sentence):
+    """Canonical form of a sentence used for cache keys."""
+    return WHITESPACE.sub(' ', sentence).strip()
+
+class SegmentCache:
+    """
+    Stores the waveform of every synthesized sentence, per voice.
+
+    Waveforms are saved as float32 .npy files so clips that share sentences
+    can be assembled without running TTS again. Keys include a fingerprint
+    of the voice's reference clip, so replacing the clip stops its old
+    segments from being reused. Disk usage is bounded by an AudioCache over
+    the segment directory.
+    """
+
+    def __init__(self, directory=AUDIO_SEGMENTS_DIR, max_size_mb=SEGMENT_CACHE_MAX_MB):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.files = AudioCache(directory, max_size_mb=max_size_mb)
+
+    def _filename(self, voice_name, sentence, fingerprint):
+        key = hashlib.md5(f"{voice_name}\n{fingerprint}\n{normalize_sentence(sentence)}".encode()).hexdigest()
+        return f"{voice_name}_{key}.npy"
+
+    def get(self, voice_name, sentence, fingerprint=None):
+        """Return the cached waveform for a sentence, or None."""
+        filename = self._filename(voice_name, sentence, fingerprint)
+        if not self.files.lookup(filename):
+            return None
+        try:
+            return np.load(os.path.join(self.directory, filename))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable audio segment {filename}: {e}")
+            return None
+
+    def put(self, voice_name, sentence, waveform, fingerprint=None):
+        """Cache the waveform of a sentence."""
+        filename = self._filename(voice_name, sentence, fingerprint)
+        path = os.path.join(self.directory, filename)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            np.save(f, np.asarray(waveform, dtype=np.float32))
+        os.replace(tmp_path, path)
+        self.files.add(filename)
+
+    def get_stats(self):
+        return self.files.get_stats()
@@ -3,44 +3,77 @@
 News Summarizer for NewsBreeze - AI-powered text summarization using Hugging Face models.
 """
 
+import os
 import logging
-from transformers import pipeline, AutoTokenizer, AutoModelForSeq2SeqLM
-import torch
-from config import SUMMARIZATION_MODEL, MAX_SUMMARY_LENGTH, MIN_SUMMARY_LENGTH
+import threading
+import extractive
+from config import (
+    SUMMARIZATION_MODEL, MAX_SUMMARY_LENGTH, MIN_SUMMARY_LENGTH,
+    SUMMARIZATION_BATCH_SIZE, MAX_INPUT_TOKENS, SUMMARY_CHUNK_OVERLAP, MAX_SUMMARY_CHUNKS,
+    SUMMARIZER_BACKEND, ONNX_MODELS_DIR
+)
 
 logger = logging.getLogger(__name__)
 
+BACKENDS = ('pytorch', 'quantized', 'onnx')
+
 class NewsSummarizer:
     """Handles AI-powered text summarization using Hugging Face models."""
     
-    def __init__(self):
+    def __init__(self, backend=SUMMARIZER_BACKEND):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown summarizer backend: {backend}")
+        
         self.model_name = SUMMARIZATION_MODEL
-        self.pipeline = None
+        self.backend = backend
         self.tokenizer = None
         self.model = None
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
-        logger.info(f"Using device: {self.device}")
+        self.prefix = ""
+        self.prefix_ids = []
+        self.generation_kwargs = {}
+        # Resolved in load_model() so importing this module doesn't pull in torch
+        self.device = None
+        self._load_lock = threading.Lock()
     
     def load_model(self):
-        """Load the summarization model."""
+        """Load the summarization model (only once, even if called concurrently)."""
+        with self._load_lock:
+            if self.is_ready():
+                return True
+            return self._load_model()
+    
+    def _load_model(self):
         try:
-            logger.info(f"Loading summarization model: {self.model_name}")
+            # Heavy ML imports are deferred until a model is actually needed
+            import torch
+            from transformers import AutoTokenizer
+            
+            # int8 dynamic quantization only has CPU kernels
+            if self.backend == 'quantized' or not torch.cuda.is_available():
+                self.device = "cpu"
+            else:
+                self.device = "cuda"
+            logger.info(f"Loading summarization model: {self.model_name} ({self.backend}, {self.device})")
             
             # Load tokenizer and model
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name)
-            self.model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+            tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+            if self.backend == 'onnx':
+                model = self._load_onnx_model()
+            else:
+                model = self._load_pytorch_model()
             
-            # Move model to appropriate device
-            if self.device == "cuda":
-                self.model = self.model.to(self.device)
+            # Task prefix and decoding defaults of the summarization task (e.g. T5's "summarize: ")
+            task_params = (model.config.task_specific_params or {}).get('summarization', {})
+            self.prefix = task_params.get('prefix') or ""
+            self.prefix_ids = tokenizer(self.prefix, add_special_tokens=False)['input_ids']
+            self.generation_kwargs = {
+                k: v for k, v in task_params.items()
+                if k not in ('prefix', 'max_length', 'min_length', 'do_sample')
+            }
             
-            # Create pipeline
-            self.pipeline = pipeline(
-                "summarization",
-                model=self.model,
-                tokenizer=self.tokenizer,
-                device=0 if self.device == "cuda" else -1
-            )
+            # Only publish the model once everything loaded, so is_ready() never sees half of it
+            self.tokenizer = tokenizer
+            self.model = model
             
             logger.info("✅ Summarization model loaded successfully")
             return True
@@ -49,9 +82,47 @@ class NewsSummarizer:
             logger.error(f"❌ Failed to load summarization model: {e}")
             return False
     
+    def _load_pytorch_model(self):
+        """Load the PyTorch model, dynamically quantized to int8 for the quantized backend."""
+        import torch
+        from transformers import AutoModelForSeq2SeqLM
+        
+        model = AutoModelForSeq2SeqLM.from_pretrained(self.model_name)
+        model.eval()
+        
+        if self.backend == 'quantized':
+            # Linear layers hold nearly all of the weights and FLOPs
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        elif self.device == "cuda":
+            model = model.to(self.device)
+        
+        return model
+    
+    def _load_onnx_model(self):
+        """
+        Load the ONNX Runtime model, exporting it on first use.
+        
+        The export is saved under ONNX_MODELS_DIR, so later starts load the
+        encoder/decoder graphs directly. Decoding reuses the past key/values.
+        """
+        from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        
+        provider = "CUDAExecutionProvider" if self.device == "cuda" else "CPUExecutionProvider"
+        export_dir = os.path.join(ONNX_MODELS_DIR, self.model_name.replace('/', '--'))
+        
+        if os.path.exists(os.path.join(export_dir, 'config.json')):
+            return ORTModelForSeq2SeqLM.from_pretrained(export_dir, use_cache=True, provider=provider)
+        
+        logger.info(f"Exporting {self.model_name} to ONNX (first run only)...")
+        model = ORTModelForSeq2SeqLM.from_pretrained(
+            self.model_name, export=True, use_cache=True, provider=provider
+        )
+        model.save_pretrained(export_dir)
+        return model
+    
     def is_ready(self):
         """Check if the model is loaded and ready."""
-        return self.pipeline is not None
+        return self.model is not None and self.tokenizer is not None
     
     def summarize(self, text, max_length=None, min_length=None):
         """
@@ -78,32 +149,11 @@ class NewsSummarizer:
                 logger.info("Text too short for summarization, returning original")
                 return cleaned_text
             
-            # Set default lengths
-            if max_length is None:
-                max_length = MAX_SUMMARY_LENGTH
-            if min_length is None:
-                min_length = MIN_SUMMARY_LENGTH
-            
-            # Adjust lengths based on input text length
-            input_length = len(cleaned_text.split())
-            max_length = min(max_length, input_length // 2)
-            min_length = min(min_length, max_length - 10)
+            logger.info(f"Summarizing text ({len(cleaned_text.split())} words)")
             
-            logger.info(f"Summarizing text ({input_length} words) -> ({min_length}-{max_length} words)")
-            
-            # Generate summary
-            summary_result = self.pipeline(
-                cleaned_text,
-                max_length=max_length,
-                min_length=min_length,
-                do_sample=False,
-                truncation=True
-            )
-            
-            summary = summary_result[0]['summary_text']
-            
-            # Post-process summary
-            summary = self._postprocess_summary(summary)
+            summary = self._summarize_cleaned({0: cleaned_text}, max_length, min_length).get(0)
+            if summary is None:
+                return self.extractive_summary(text)
             
             logger.info(f"Summary generated: {len(summary.split())} words")
             return summary
@@ -111,7 +161,7 @@ class NewsSummarizer:
         except Exception as e:
             logger.error(f"Error during summarization: {e}")
             # Fallback to extractive summarization
-            return self._extractive_summary(text)
+            return self.extractive_summary(text)
     
     def _preprocess_text(self, text):
         """Clean and prepare text for summarization."""
@@ -133,11 +183,7 @@ class NewsSummarizer:
         text = re.sub(r'[!]{2,}', '!', text)
         text = re.sub(r'[?]{2,}', '?', text)
         
-        # Limit length for model input
-        words = text.split()
-        if len(words) > 1000:  # Most models have token limits
-            text = ' '.join(words[:1000])
-        
+        # Length is limited later, in tokens, by _encode()
         return text.strip()
     
     def _postprocess_summary(self, summary):
@@ -170,90 +216,197 @@ class NewsSummarizer:
         
         return summary
     
-    def _extractive_summary(self, text, num_sentences=3):
+    def extractive_summary(self, text, num_sentences=3):
         """
         Fallback extractive summarization using sentence ranking.
+        
+        Needs no model, so it also serves as an instant first summary.
         """
-        try:
-            import nltk
-            from collections import Counter
-            import string
-            
-            # Download required NLTK data
-            try:
-                nltk.data.find('tokenizers/punkt')
-            except LookupError:
-                nltk.download('punkt')
-            
-            # Tokenize into sentences
-            sentences = nltk.sent_tokenize(text)
-            
-            if len(sentences) <= num_sentences:
-                return text
-            
-            # Simple word frequency-based ranking
-            words = text.lower().split()
-            words = [word.strip(string.punctuation) for word in words]
-            word_freq = Counter(words)
-            
-            # Score sentences based on word frequency
-            sentence_scores = {}
-            for sentence in sentences:
-                sentence_words = sentence.lower().split()
-                sentence_words = [word.strip(string.punctuation) for word in sentence_words]
-                score = sum(word_freq[word] for word in sentence_words if word in word_freq)
-                sentence_scores[sentence] = score
-            
-            # Get top sentences
-            top_sentences = sorted(sentence_scores.items(), key=lambda x: x[1], reverse=True)[:num_sentences]
-            
-            # Maintain original order
-            summary_sentences = []
-            for sentence in sentences:
-                if any(sentence == top_sent[0] for top_sent in top_sentences):
-                    summary_sentences.append(sentence)
-                if len(summary_sentences) >= num_sentences:
-                    break
-            
-            return ' '.join(summary_sentences)
-            
-        except Exception as e:
-            logger.error(f"Extractive summarization failed: {e}")
-            # Ultimate fallback - return first few sentences
-            sentences = text.split('. ')
-            return '. '.join(sentences[:3]) + '.'
+        return extractive.summarize(text, num_sentences)
     
-    def batch_summarize(self, texts, max_length=None, min_length=None):
+    def batch_summarize(self, texts, max_length=None, min_length=None, batch_size=None):
         """
-        Summarize multiple texts in batch for efficiency.
+        Summarize multiple texts with batched generation.
+        
+        Inputs are sorted by token length and grouped into batches, so each
+        generate() call pads to a similar length. Articles longer than the
+        context window are summarized chunk by chunk (see _summarize_cleaned).
         
         Args:
             texts: List of texts to summarize
             max_length: Maximum length of summaries
             min_length: Minimum length of summaries
+            batch_size: Sequences per forward pass (defaults to SUMMARIZATION_BATCH_SIZE)
             
         Returns:
-            List of summarized texts
+            List of summarized texts, in the same order as `texts`
         """
         if not self.is_ready():
             if not self.load_model():
                 raise Exception("Failed to load summarization model")
         
-        summaries = []
-        for text in texts:
+        summaries = [None] * len(texts)
+        pending = {}
+        
+        for index, text in enumerate(texts):
+            cleaned_text = self._preprocess_text(text)
+            if len(cleaned_text.split()) < 50:
+                summaries[index] = cleaned_text
+            else:
+                pending[index] = cleaned_text
+        
+        generated = self._summarize_cleaned(pending, max_length, min_length, batch_size)
+        for index, summary in generated.items():
+            summaries[index] = summary
+        
+        failed = [index for index in pending if index not in generated]
+        if failed:
+            for index, summary in zip(failed, extractive.summarize_batch([texts[index] for index in failed])):
+                summaries[index] = summary
+        
+        logger.info(f"Batch summarized {len(texts)} texts ({len(pending)} through the model)")
+        return summaries
+    
+    def _summarize_cleaned(self, texts, max_length=None, min_length=None, batch_size=None):
+        """
+        Summarize preprocessed texts with the model.
+        
+        Each text is tokenized once. Texts that fit the context window are
+        summarized directly. Longer ones are map-reduced: all of their chunks
+        are summarized together in the first round of batches, then each
+        text's partial summaries are joined and summarized alongside the
+        short texts.
+        
+        Args:
+            texts: Dictionary mapping a key to cleaned text
+            
+        Returns:
+            Dictionary mapping each key to its summary; keys whose generation
+            failed are missing
+        """
+        if max_length is None:
+            max_length = MAX_SUMMARY_LENGTH
+        if min_length is None:
+            min_length = MIN_SUMMARY_LENGTH
+        if batch_size is None:
+            batch_size = SUMMARIZATION_BATCH_SIZE
+        
+        final = []
+        chunks = []
+        chunk_counts = {}
+        
+        for key, text in texts.items():
+            # Shorter inputs get proportionally shorter summaries
+            input_length = len(text.split())
+            text_max_length = min(max_length, input_length // 2)
+            text_min_length = min(min_length, text_max_length - 10)
+            
+            inputs = self._encode(text)
+            if len(inputs) == 1:
+                final.append((key, inputs[0], text_max_length, text_min_length))
+                continue
+            
+            # Size partial summaries so their concatenation fits one input
+            chunk_max_length = max(min_length, min(max_length, self._token_budget() // len(inputs)))
+            chunk_counts[key] = (len(inputs), text_max_length, text_min_length)
+            chunks.extend(
+                ((key, position), input_ids, chunk_max_length, min(min_length, chunk_max_length // 2))
+                for position, input_ids in enumerate(inputs)
+            )
+        
+        if chunks:
+            logger.info(f"Map-reducing {len(chunk_counts)} long texts over {len(chunks)} chunks")
+            partials = self._generate_batches(chunks, batch_size)
+            for key, (count, text_max_length, text_min_length) in chunk_counts.items():
+                parts = [partials.get((key, position)) for position in range(count)]
+                if None in parts:
+                    continue
+                final.append((key, self._encode(' '.join(parts))[0], text_max_length, text_min_length))
+        
+        return {
+            key: self._postprocess_summary(summary)
+            for key, summary in self._generate_batches(final, batch_size).items()
+        }
+    
+    def _generate_batches(self, items, batch_size):
+        """
+        Generate outputs for (key, input_ids, max_length, min_length) items.
+        
+        Returns:
+            Dictionary mapping key to generated text; keys from failed
+            batches are missing
+        """
+        # Group inputs of similar token length to minimize padding; a batch
+        # generates up to its longest max_length and at least its shortest min_length
+        items = sorted(items, key=lambda item: len(item[1]))
+        outputs = {}
+        
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
             try:
-                summary = self.summarize(text, max_length, min_length)
-                summaries.append(summary)
+                generated = self._generate(
+                    [input_ids for _, input_ids, _, _ in batch],
+                    max(item[2] for item in batch),
+                    min(item[3] for item in batch)
+                )
             except Exception as e:
-                logger.error(f"Error summarizing text: {e}")
-                summaries.append(self._extractive_summary(text))
+                logger.error(f"Error summarizing batch: {e}")
+                continue
+            for (key, _, _, _), text in zip(batch, generated):
+                outputs[key] = text
         
-        return summaries
+        return outputs
+    
+    def _token_budget(self):
+        """Content tokens per model input, after the task prefix and special tokens."""
+        return MAX_INPUT_TOKENS - len(self.prefix_ids) - self.tokenizer.num_special_tokens_to_add()
+    
+    def _encode(self, text):
+        """
+        Tokenize text once and split it into model-sized inputs.
+        
+        Returns:
+            List of input ID lists with the task prefix and special tokens,
+            each at most MAX_INPUT_TOKENS long. Text that fits the context
+            window yields one input; longer text yields overlapping chunks,
+            up to MAX_SUMMARY_CHUNKS.
+        """
+        ids = self.tokenizer(text, add_special_tokens=False, verbose=False)['input_ids']
+        budget = self._token_budget()
+        step = budget - SUMMARY_CHUNK_OVERLAP
+        starts = range(0, max(len(ids) - SUMMARY_CHUNK_OVERLAP, 1), step)[:MAX_SUMMARY_CHUNKS]
+        return [
+            self.tokenizer.build_inputs_with_special_tokens(self.prefix_ids + ids[start:start + budget])
+            for start in starts
+        ]
+
+    def _generate(self, batch_input_ids, max_length, min_length):
+        """Run one padded generate() call over a batch of tokenized inputs."""
+        import torch
+        
+        inputs = self.tokenizer.pad(
+            {'input_ids': batch_input_ids},
+            padding=True,
+            return_tensors='pt'
+        )
+        inputs = {k: v.to(self.model.device) for k, v in inputs.items()}
+        
+        with torch.inference_mode():
+            output_ids = self.model.generate(
+                **inputs,
+                max_length=max_length,
+                min_length=min_length,
+                do_sample=False,
+                **self.generation_kwargs
+            )
+        
+        return self.tokenizer.batch_decode(output_ids, skip_special_tokens=True)
     
     def get_model_info(self):
         """Get information about the loaded model."""
         return {
             'model_name': self.model_name,
+            'backend': self.backend,
             'device': self.device,
             'is_ready': self.is_ready(),
             'max_summary_length': MAX_SUMMARY_LENGTH,
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Summary Store for NewsBreeze - SQLite-backed summary cache with an in-process LRU.
+"""
+
+import sqlite3
+import threading
+import time
+import logging
+from collections import OrderedDict
+from config import CACHE_EXPIRY_HOURS, SUMMARY_CACHE_MAX_MB, SUMMARY_MEMORY_ITEMS
+
+logger = logging.getLogger(__name__)
+
+class SummaryStore:
+    """
+    Indexed summary cache.
+
+    Summaries live in one SQLite table keyed by content hash. Entries expire
+    after `ttl_hours` and the least recently used ones are evicted once the
+    stored text exceeds `max_size_mb`. Hot entries are served from an
+    in-memory LRU without touching the database; their access times are
+    written back in one batch before each eviction pass.
+    """
+
+    EVICT_EVERY = 100  # puts between eviction passes
+
+    def __init__(self, db_path, ttl_hours=CACHE_EXPIRY_HOURS,
+                 max_size_mb=SUMMARY_CACHE_MAX_MB, memory_items=SUMMARY_MEMORY_ITEMS):
+        self.db_path = db_path
+        self.ttl = ttl_hours * 3600
+        self.max_size = max_size_mb * 1024 * 1024
+        self.memory_items = memory_items
+
+        self._lru = OrderedDict()
+        self._accessed = {}
+        self._lock = threading.Lock()
+        self._puts = 0
+        self.hits = 0
+        self.misses = 0
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                summary TEXT NOT NULL,
+                url TEXT,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_accessed ON summaries(accessed_at)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_summaries_created ON summaries(created_at)")
+        self.evict()
+
+    def get(self, key):
+        """Return the cached summary for `key`, or None if missing or expired."""
+        now = time.time()
+        with self._lock:
+            entry = self._lru.get(key)
+            if entry is not None and now - entry[1] < self.ttl:
+                self._lru.move_to_end(key)
+                self._accessed[key] = now
+                if len(self._accessed) > self.memory_items:
+                    self._flush_accessed()
+                self.hits += 1
+                return entry[0]
+
+            row = self._conn.execute(
+                "SELECT summary, created_at FROM summaries WHERE key = ? AND created_at > ?",
+                (key, now - self.ttl)
+            ).fetchone()
+
+            if row is None:
+                self._lru.pop(key, None)
+                self.misses += 1
+                return None
+
+            self._conn.execute("UPDATE summaries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._remember(key, row[0], row[1])
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, summary, url=None):
+        """Store a summary under `key`."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summaries (key, summary, url, created_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, summary, url, now, now, len(summary.encode('utf-8')) + len(key))
+            )
+            self._remember(key, summary, now)
+            self._puts += 1
+            should_evict = self._puts % self.EVICT_EVERY == 0
+
+        if should_evict:
+            self.evict()
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones until under budget."""
+        with self._lock:
+            self._flush_accessed()
+            now = time.time()
+            expired = self._conn.execute(
+                "DELETE FROM summaries WHERE created_at <= ?", (now - self.ttl,)
+            ).rowcount
+
+            evicted = 0
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+            while total > self.max_size:
+                rows = self._conn.execute(
+                    "SELECT key, size FROM summaries ORDER BY accessed_at LIMIT 500"
+                ).fetchall()
+                if not rows:
+                    break
+                batch = []
+                for key, size in rows:
+                    batch.append((key,))
+                    self._lru.pop(key, None)
+                    total -= size
+                    if total <= self.max_size:
+                        break
+                self._conn.executemany("DELETE FROM summaries WHERE key = ?", batch)
+                evicted += len(batch)
+
+        if expired or evicted:
+            logger.info(f"Summary store evicted {expired} expired and {evicted} LRU entries")
+
+    def get_stats(self):
+        """Entry count, stored size and hit rate."""
+        with self._lock:
+            count, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM summaries"
+            ).fetchone()
+            return {
+                'entries': count,
+                'size_mb': round(size / (1024 * 1024), 2),
+                'memory_entries': len(self._lru),
+                'hits': self.hits,
+                'misses': self.misses
+            }
+
+    def _flush_accessed(self):
+        """Persist access times of in-memory hits (caller holds the lock)."""
+        if self._accessed:
+            self._conn.executemany(
+                "UPDATE summaries SET accessed_at = MAX(accessed_at, ?) WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._accessed.items()]
+            )
+            self._accessed.clear()
+
+    def _remember(self, key, summary, created_at):
+        """Add an entry to the in-memory LRU (caller holds the lock)."""
+        self._lru[key] = (summary, created_at)
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.memory_items:
+            self._lru.popitem(last=False)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Synthesis Jobs for NewsBreeze - asynchronous voice synthesis with status polling.
+"""
+
+import threading
+import time
+import uuid
+import logging
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from config import SYNTHESIS_WORKERS, MAX_PENDING_SYNTHESIS_JOBS, JOB_RETENTION_MINUTES
+
+logger = logging.getLogger(__name__)
+
+class SynthesisJobManager:
+    """
+    Runs voice synthesis on a bounded worker pool and tracks job status.
+
+    Jobs move through queued -> running -> done/failed. At most
+    `max_pending` jobs may be queued or running at once; identical requests
+    that are still pending share one job. Finished jobs are kept for
+    `retention_minutes` so clients can collect the result.
+    """
+
+    def __init__(self, synthesize_fn, max_workers=SYNTHESIS_WORKERS,
+                 max_pending=MAX_PENDING_SYNTHESIS_JOBS, retention_minutes=JOB_RETENTION_MINUTES):
+        self.synthesize_fn = synthesize_fn
+        self.max_pending = max_pending
+        self.retention = retention_minutes * 60
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='tts-job')
+
+        self._jobs = OrderedDict()
+        self._pending_by_key = {}
+        self._lock = threading.Lock()
+
+    def submit(self, cache_key, text, voice_name, article_id=None):
+        """
+        Queue a synthesis job.
+
+        Returns:
+            The job dictionary, or None if too many jobs are pending
+        """
+        with self._lock:
+            self._prune()
+
+            job_id = self._pending_by_key.get(cache_key)
+            if job_id:
+                return dict(self._jobs[job_id])
+
+            if len(self._pending_by_key) >= self.max_pending:
+                return None
+
+            job_id = uuid.uuid4().hex
+            self._jobs[job_id] = {
+                'job_id': job_id,
+                'status': 'queued',
+                'voice': voice_name,
+                'article_id': article_id,
+                'created_at': time.time(),
+                'finished_at': None,
+                'audio_file': None,
+                'error': None
+            }
+            self._pending_by_key[cache_key] = job_id
+            job = dict(self._jobs[job_id])
+
+        self.executor.submit(self._run, job_id, cache_key, text, voice_name, article_id)
+        logger.info(f"Queued synthesis job {job_id} ({voice_name})")
+        return job
+
+    def complete(self, audio_file, voice_name, article_id=None):
+        """Record an already-finished job, e.g. for a cache hit."""
+        job_id = uuid.uuid4().hex
+        now = time.time()
+        job = {
+            'job_id': job_id,
+            'status': 'done',
+            'voice': voice_name,
+            'article_id': article_id,
+            'created_at': now,
+            'finished_at': now,
+            'audio_file': audio_file,
+            'error': None
+        }
+        with self._lock:
+            self._prune()
+            self._jobs[job_id] = job
+        return dict(job)
+
+    def get(self, job_id):
+        """Return a copy of the job, or None if unknown or expired."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def get_stats(self):
+        """Counts of jobs by status."""
+        with self._lock:
+            stats = {'queued': 0, 'running': 0, 'done': 0, 'failed': 0}
+            for job in self._jobs.values():
+                stats[job['status']] += 1
+            return stats
+
+    def _run(self, job_id, cache_key, text, voice_name, article_id):
+        """Worker: run the synthesis and record the outcome."""
+        self._update(job_id, status='running')
+        try:
+            result = self.synthesize_fn(text, voice_name, article_id)
+            if result.get('success'):
+                self._update(job_id, status='done', audio_file=result['audio_file'])
+            else:
+                self._update(job_id, status='failed', error=result.get('error', 'Voice synthesis failed'))
+        except Exception as e:
+            logger.error(f"Synthesis job {job_id} failed: {e}")
+            self._update(job_id, status='failed', error=str(e))
+        finally:
+            with self._lock:
+                self._pending_by_key.pop(cache_key, None)
+
+    def _update(self, job_id, **fields):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields)
+            if fields.get('status') in ('done', 'failed'):
+                job['finished_at'] = time.time()
+
+    def _prune(self):
+        """Forget finished jobs past the retention window (caller holds the lock)."""
+        cutoff = time.time() - self.retention
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job['finished_at'] is not None and job['finished_at'] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
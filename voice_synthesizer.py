@@ -5,26 +5,50 @@ Voice Synthesizer for NewsBreeze - Celebrity voice cloning using Coqui TTS.
 
 import os
 import logging
-import torch
-from TTS.api import TTS
-from config import VOICE_MODEL, VOICES_DIR, AUDIO_SAMPLE_RATE
+import threading
+from audio_utils import split_sentences, crossfade_concat, to_pcm16, write_wav
+from segment_cache import SegmentCache
+from config import (
+    VOICE_MODEL, VOICES_DIR, AUDIO_SAMPLE_RATE,
+    MAX_SYNTHESIS_CHARS, CROSSFADE_MS, SPEAKER_LATENTS_DIR
+)
 
 logger = logging.getLogger(__name__)
 
+def _reference_fingerprint(speaker_wav):
+    """Size and modification time of a reference clip; changes when the clip is replaced."""
+    stat = os.stat(speaker_wav)
+    return [stat.st_size, stat.st_mtime_ns]
+
 class VoiceSynthesizer:
     """Handles voice synthesis using Coqui TTS with celebrity voice cloning."""
     
     def __init__(self):
         self.model_name = VOICE_MODEL
         self.tts = None
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = None  # set when the model loads
         self.available_voices = self._get_available_voices()
-        logger.info(f"Voice synthesis device: {self.device}")
+        # voice_name -> (reference fingerprint, gpt_cond_latent, speaker_embedding)
+        self._speaker_latents = {}
+        self._latents_lock = threading.Lock()
+        self.segment_cache = SegmentCache()
+        self._load_lock = threading.Lock()
     
     def load_model(self):
-        """Load the TTS model."""
+        """Load the TTS model (only once, even if called concurrently)."""
+        with self._load_lock:
+            if self.is_ready():
+                return True
+            return self._load_model()
+    
+    def _load_model(self):
         try:
-            logger.info(f"Loading TTS model: {self.model_name}")
+            # torch/TTS take seconds to import; only pay for it when loading
+            import torch
+            from TTS.api import TTS
+            
+            self.device = "cuda" if torch.cuda.is_available() else "cpu"
+            logger.info(f"Loading TTS model: {self.model_name} ({self.device})")
             
             # Initialize TTS with the specified model
             self.tts = TTS(
@@ -34,6 +58,15 @@ class VoiceSynthesizer:
             )
             
             logger.info("✅ TTS model loaded successfully")
+            
+            # Warm the speaker latents cache for the bundled voices
+            for voice_id, config in self.available_voices.items():
+                if config.get('reference_audio'):
+                    try:
+                        self._get_speaker_latents(voice_id, config['reference_audio'])
+                    except Exception as e:
+                        logger.warning(f"Could not prepare speaker latents for {voice_id}: {e}")
+            
             return True
             
         except Exception as e:
@@ -63,11 +96,7 @@ class VoiceSynthesizer:
         
         try:
             # Get voice configuration
-            voice_config = self.available_voices.get(voice_name)
-            if not voice_config:
-                logger.warning(f"Voice {voice_name} not found, using default")
-                voice_name = "morgan_freeman"
-                voice_config = self.available_voices[voice_name]
+            voice_name, voice_config = self._resolve_voice(voice_name)
             
             # Prepare text
             cleaned_text = self._prepare_text(text)
@@ -79,13 +108,10 @@ class VoiceSynthesizer:
             speaker_wav = voice_config.get('reference_audio')
             
             if speaker_wav and os.path.exists(speaker_wav):
-                # Use voice cloning with reference audio
-                self.tts.tts_to_file(
-                    text=cleaned_text,
-                    speaker_wav=speaker_wav,
-                    language="en",
-                    file_path=output_path
-                )
+                # Use voice cloning with reference audio, reusing cached sentences
+                waveforms = list(self._sentence_waveforms(cleaned_text, speaker_wav, voice_name))
+                waveform = crossfade_concat(waveforms, self.output_sample_rate, CROSSFADE_MS)
+                write_wav(output_path, to_pcm16(waveform), self.output_sample_rate)
             else:
                 # Use built-in voice or fallback
                 logger.warning(f"Reference audio not found for {voice_name}, using fallback")
@@ -98,8 +124,134 @@ class VoiceSynthesizer:
             logger.error(f"❌ Voice synthesis failed: {e}")
             return False
     
-    def _prepare_text(self, text):
-        """Prepare text for speech synthesis."""
+    def synthesize_stream(self, text, voice_name="morgan_freeman"):
+        """
+        Synthesize speech sentence by sentence, in order.
+        
+        Each sentence is yielded as soon as it is synthesized (or read from
+        the segment cache), so playback can start early. Nothing is truncated.
+        
+        Args:
+            text: Text to synthesize
+            voice_name: Name of the voice to use
+            
+        Yields:
+            Float waveforms (sampled at `output_sample_rate`), one per sentence
+        """
+        if not self.is_ready():
+            logger.info("TTS model not loaded, loading now...")
+            if not self.load_model():
+                raise Exception("Failed to load TTS model")
+        
+        voice_name, voice_config = self._resolve_voice(voice_name)
+        speaker_wav = voice_config.get('reference_audio')
+        if not (speaker_wav and os.path.exists(speaker_wav)):
+            speaker_wav = None
+        
+        cleaned_text = self._prepare_text(text, max_chars=None)
+        logger.info(f"Streaming speech with {voice_name} voice...")
+        
+        yield from self._sentence_waveforms(cleaned_text, speaker_wav, voice_name)
+    
+    @property
+    def output_sample_rate(self):
+        """Sample rate of the waveforms produced by the loaded model."""
+        try:
+            return self.tts.synthesizer.output_sample_rate
+        except AttributeError:
+            return AUDIO_SAMPLE_RATE
+    
+    def _sentence_waveforms(self, text, speaker_wav, voice_name):
+        """Yield one waveform per sentence, synthesizing only uncached sentences."""
+        sentences = split_sentences(text)
+        fingerprint = _reference_fingerprint(speaker_wav) if speaker_wav else None
+        hits = 0
+        
+        for sentence in sentences:
+            waveform = self.segment_cache.get(voice_name, sentence, fingerprint)
+            if waveform is None:
+                waveform = self._synthesize_waveform(sentence, speaker_wav, voice_name)
+                self.segment_cache.put(voice_name, sentence, waveform, fingerprint)
+            else:
+                hits += 1
+            yield waveform
+        
+        logger.info(f"Reused {hits}/{len(sentences)} cached sentence segments")
+    
+    def _synthesize_waveform(self, text, speaker_wav=None, voice_name=None):
+        """Synthesize one chunk of text to an in-memory waveform."""
+        if speaker_wav:
+            latents = self._get_speaker_latents(voice_name, speaker_wav) if voice_name else None
+            if latents:
+                # Skip the speaker encoder by conditioning on cached latents
+                gpt_cond_latent, speaker_embedding = latents
+                output = self.tts.synthesizer.tts_model.inference(
+                    text, "en", gpt_cond_latent, speaker_embedding
+                )
+                return output['wav']
+            return self.tts.tts(text=text, speaker_wav=speaker_wav, language="en")
+        return self.tts.tts(text=text)
+    
+    def _get_speaker_latents(self, voice_name, speaker_wav):
+        """
+        Return (gpt_cond_latent, speaker_embedding) for a voice.
+        
+        Latents are computed once from the reference clip, kept in memory and
+        persisted under SPEAKER_LATENTS_DIR. They are recomputed when the
+        reference file's size or modification time changes. Returns None if
+        the loaded model does not support conditioning latents.
+        """
+        tts_model = getattr(getattr(self.tts, 'synthesizer', None), 'tts_model', None)
+        if not hasattr(tts_model, 'get_conditioning_latents'):
+            return None
+        
+        import torch
+        
+        fingerprint = _reference_fingerprint(speaker_wav)
+        
+        with self._latents_lock:
+            cached = self._speaker_latents.get(voice_name)
+            if cached and cached[0] == fingerprint:
+                return cached[1], cached[2]
+            
+            latents_path = os.path.join(SPEAKER_LATENTS_DIR, f"{voice_name}.pt")
+            latents = None
+            
+            if os.path.exists(latents_path):
+                try:
+                    saved = torch.load(latents_path, map_location=self.device)
+                    if saved.get('fingerprint') == fingerprint:
+                        latents = (saved['gpt_cond_latent'], saved['speaker_embedding'])
+                except Exception as e:
+                    logger.warning(f"Could not load speaker latents for {voice_name}: {e}")
+            
+            if latents is None:
+                logger.info(f"Computing speaker latents for {voice_name}...")
+                latents = tts_model.get_conditioning_latents(audio_path=[speaker_wav])
+                try:
+                    os.makedirs(SPEAKER_LATENTS_DIR, exist_ok=True)
+                    torch.save({
+                        'fingerprint': fingerprint,
+                        'gpt_cond_latent': latents[0],
+                        'speaker_embedding': latents[1]
+                    }, latents_path)
+                except Exception as e:
+                    logger.warning(f"Could not persist speaker latents for {voice_name}: {e}")
+            
+            self._speaker_latents[voice_name] = (fingerprint, latents[0], latents[1])
+            return latents
+    
+    def _resolve_voice(self, voice_name):
+        """Return (voice_name, voice_config), falling back to the default voice."""
+        voice_config = self.available_voices.get(voice_name)
+        if not voice_config:
+            logger.warning(f"Voice {voice_name} not found, using default")
+            voice_name = "morgan_freeman"
+            voice_config = self.available_voices[voice_name]
+        return voice_name, voice_config
+    
+    def _prepare_text(self, text, max_chars=MAX_SYNTHESIS_CHARS):
+        """Prepare text for speech synthesis (truncated to `max_chars` unless None)."""
         if not text:
             return ""
         
@@ -130,14 +282,14 @@ class VoiceSynthesizer:
         text = re.sub(r',(\s+)', r', ', text)
         
         # Limit length for better synthesis
-        if len(text) > 1000:
+        if max_chars is not None and len(text) > max_chars:
             # Find a good breaking point
             sentences = text.split('. ')
             truncated = []
             char_count = 0
             
             for sentence in sentences:
-                if char_count + len(sentence) > 1000:
+                if char_count + len(sentence) > max_chars:
                     break
                 truncated.append(sentence)
                 char_count += len(sentence) + 2
@@ -283,6 +435,12 @@ class VoiceSynthesizer:
                 "gender": "unknown"
             }
             
+            # Precompute conditioning latents now so the first synthesis skips the encoder
+            if self.is_ready():
+                self._get_speaker_latents(voice_name, target_path)
+            else:
+                logger.info(f"Speaker latents for {voice_name} will be computed on first use")
+            
             logger.info(f"✅ Voice {voice_name} cloned successfully")
             return True
             